@@ -8,7 +8,7 @@ from starlette.responses import JSONResponse, StreamingResponse
 from backend.models.chat import ChatRequest
 from backend.services.conversation_manager import ConversationManager
 from backend.services.mistral_service import MistralService
-from backend.utils.validators import validate_message, validate_conversation_id, validate_model_params
+from backend.utils.validators import validate_chat_request
 from backend.utils.logger import setup_logger
 from backend.middleware.error_handler import create_error_response
 
@@ -49,15 +49,9 @@ class ChatRoutes:
             chat_request = ChatRequest.from_dict(body)
 
             # Validate inputs
-            is_valid, error = validate_message(chat_request.message)
-            if not is_valid:
-                return create_error_response(400, error, "validation_error")
-
-            is_valid, error = validate_conversation_id(chat_request.conversation_id)
-            if not is_valid:
-                return create_error_response(400, error, "validation_error")
-
-            is_valid, error = validate_model_params(
+            is_valid, error = validate_chat_request(
+                chat_request.message,
+                chat_request.conversation_id,
                 chat_request.temperature,
                 chat_request.max_tokens
             )
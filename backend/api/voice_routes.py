@@ -6,8 +6,6 @@ Design Pattern: Controller Pattern
 Purpose: Separate routing logic from business logic
 """
 import logging
-import tempfile
-import os
 from pathlib import Path
 
 from starlette.requests import Request
@@ -94,42 +92,24 @@ class VoiceRoutes:
                     status_code=400
                 )
 
-            # Save to temporary file for processing
-            suffix = file_extension or '.webm'
-
-            with tempfile.NamedTemporaryFile(
-                mode='wb',
-                suffix=suffix,
-                delete=False
-            ) as temp_file:
-                temp_file.write(audio_content)
-                temp_file_path = temp_file.name
-
-            try:
-                # Transcribe audio through Voxtral service
-                logger.info(f"Transcribing audio: {filename}")
-                result = await self.voxtral_service.transcribe_audio(
-                    audio_path=temp_file_path,
-                    language=language
-                )
+            # Transcribe audio through Voxtral service
+            logger.info(f"Transcribing audio: {filename}")
+            result = await self.voxtral_service.transcribe_audio_bytes(
+                audio_content,
+                filename=filename,
+                language=language
+            )
 
-                logger.info(
-                    f"Transcription successful: {len(result['text'])} characters"
-                )
+            logger.info(
+                f"Transcription successful: {len(result['text'])} characters"
+            )
 
-                return JSONResponse({
-                    'success': True,
-                    'text': result['text'],
-                    'language': result.get('language'),
-                    'model': result.get('model')
-                })
-
-            finally:
-                # Clean up temporary file
-                try:
-                    os.unlink(temp_file_path)
-                except Exception as e:
-                    logger.warning(f"Failed to delete temp file: {e}")
+            return JSONResponse({
+                'success': True,
+                'text': result['text'],
+                'language': result.get('language'),
+                'model': result.get('model')
+            })
 
         except Exception as e:
             logger.error(f"Audio transcription error: {e}", exc_info=True)
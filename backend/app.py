@@ -75,16 +75,28 @@ class Application:
                 embedding_service=embedding_service,
                 mistral_service=self.mistral_service,
                 default_top_k=self.config.rag.top_k_results if self.config.rag else 5,
-                similarity_threshold=self.config.rag.similarity_threshold if self.config.rag else 0.7
+                similarity_threshold=self.config.rag.similarity_threshold if self.config.rag else 0.7,
+                max_context_tokens=self.config.rag.max_context_tokens if self.config.rag else 3000,
+                skip_llm_on_empty=self.config.rag.skip_llm_on_empty if self.config.rag else True
             )
 
             # Create ingestion service
             parser = DocumentParser()
-            chunker = TextChunker(
-                strategy=self.config.rag.chunking_strategy if self.config.rag else 'fixed_size',
-                chunk_size=self.config.rag.chunk_size if self.config.rag else 500,
-                overlap=self.config.rag.chunk_overlap if self.config.rag else 50
-            )
+            chunk_size = self.config.rag.chunk_size if self.config.rag else 500
+            chunk_overlap = self.config.rag.chunk_overlap if self.config.rag else 50
+            chunking_strategy = self.config.rag.chunking_strategy if self.config.rag else 'fixed_size'
+            if chunking_strategy == 'sliding_window':
+                chunker = TextChunker(
+                    strategy=chunking_strategy,
+                    window=chunk_size,
+                    stride=chunk_size - chunk_overlap
+                )
+            else:
+                chunker = TextChunker(
+                    strategy=chunking_strategy,
+                    chunk_size=chunk_size,
+                    overlap=chunk_overlap
+                )
 
             self.ingestion_service = SyllabusIngestionService(
                 vector_db=vector_db,
@@ -178,7 +190,9 @@ class Application:
             # Initialize RAG vector database connection
             if self.rag_service:
                 try:
-                    await self.rag_service.vector_db.initialize()
+                    await self.rag_service.vector_db.initialize(
+                        expected_dim=self.rag_service.embedding_service.dimension
+                    )
                     health = await self.rag_service.vector_db.health_check()
                     if health:
                         logger.info("✓ RAG system operational")
@@ -194,6 +208,12 @@ class Application:
             """Run on application shutdown."""
             logger.info("Application shutting down...")
             await self.mistral_service.close()
+            if self.rag_service:
+                await self.rag_service.aclose()
+            if self.file_ingestion_service:
+                self.file_ingestion_service.close()
+            if self.ingestion_service:
+                self.ingestion_service.close()
 
         return app
 
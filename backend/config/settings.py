@@ -51,9 +51,11 @@ class RAGConfig:
     """RAG (Retrieval-Augmented Generation) configuration."""
     chunk_size: int = 500
     chunk_overlap: int = 50
-    chunking_strategy: str = "fixed_size"  # 'fixed_size', 'sentence', 'section'
+    chunking_strategy: str = "fixed_size"  # 'fixed_size', 'sliding_window', 'sentence', 'section'
     top_k_results: int = 5
     similarity_threshold: float = 0.7
+    max_context_tokens: int = 3000
+    skip_llm_on_empty: bool = True
 
 
 @dataclass
@@ -108,7 +110,9 @@ def load_config() -> AppConfig:
             chunk_overlap=int(os.getenv("RAG_CHUNK_OVERLAP", "50")),
             chunking_strategy=os.getenv("RAG_CHUNKING_STRATEGY", "fixed_size"),
             top_k_results=int(os.getenv("RAG_TOP_K", "5")),
-            similarity_threshold=float(os.getenv("RAG_SIMILARITY_THRESHOLD", "0.7"))
+            similarity_threshold=float(os.getenv("RAG_SIMILARITY_THRESHOLD", "0.7")),
+            max_context_tokens=int(os.getenv("RAG_MAX_CONTEXT_TOKENS", "3000")),
+            skip_llm_on_empty=os.getenv("RAG_SKIP_LLM_ON_EMPTY", "true").lower() == "true"
         )
 
     return AppConfig(
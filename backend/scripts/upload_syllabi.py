@@ -6,6 +6,7 @@ Usage:
     python upload_syllabi.py /path/to/syllabi/folder/
     python upload_syllabi.py /path/to/syllabi/folder/ --recursive
     python upload_syllabi.py single_file.pdf
+    python upload_syllabi.py /path/to/syllabi/folder/ --force
 """
 import asyncio
 import argparse
@@ -70,6 +71,11 @@ async def main():
         default=50,
         help='Chunk overlap in characters (default: 50)'
     )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Re-ingest files even if unchanged since their last upload'
+    )
     parser.add_argument(
         '--extensions',
         nargs='+',
@@ -92,6 +98,8 @@ async def main():
         logger.error("Mistral API key required. Set MISTRAL_API_KEY env var or use --mistral-api-key")
         sys.exit(1)
 
+    ingestion_service = None
+
     try:
         # Initialize services
         logger.info("Initializing services...")
@@ -106,7 +114,7 @@ async def main():
                 'metric': 'cosine'
             }
         )
-        await vector_db.initialize()
+        await vector_db.initialize(expected_dim=EmbeddingService.EMBEDDING_DIMENSION)
 
         # Check health
         health = await vector_db.health_check()
@@ -146,9 +154,12 @@ async def main():
         if path.is_file():
             # Single file upload
             logger.info(f"\nUploading single file: {path}")
-            result = await ingestion_service.ingest_file(str(path))
+            result = await ingestion_service.ingest_file(str(path), force=args.force)
 
-            if result.success:
+            if result.skipped:
+                logger.info("✓ Unchanged since last upload, skipped (use --force to re-ingest)")
+                logger.info(f"  Document ID: {result.document_id}")
+            elif result.success:
                 logger.info(f"✓ Success! Created {result.chunks_created} chunks")
                 logger.info(f"  Document ID: {result.document_id}")
                 logger.info(f"  Metadata: {result.metadata}")
@@ -166,7 +177,8 @@ async def main():
                 directory_path=str(path),
                 file_extensions=args.extensions,
                 recursive=args.recursive,
-                show_progress=True
+                show_progress=True,
+                force=args.force
             )
 
             # Print summary
@@ -175,6 +187,7 @@ async def main():
             print("=" * 60)
             print(f"Total files:       {result.total_files}")
             print(f"Successful:        {result.successful}")
+            print(f"Skipped:           {result.skipped} (unchanged; use --force to re-ingest)")
             print(f"Failed:            {result.failed}")
             print(f"Total chunks:      {result.total_chunks}")
             print("=" * 60)
@@ -207,6 +220,11 @@ async def main():
         logger.error(f"\n✗ Upload failed: {e}", exc_info=True)
         sys.exit(1)
 
+    finally:
+        # Saves the unchanged-file cache for every path, including single files
+        if ingestion_service:
+            ingestion_service.close()
+
 
 if __name__ == '__main__':
     asyncio.run(main())
@@ -2,6 +2,7 @@
 Email service for sending notifications and digests.
 Uses SendGrid for reliable email delivery.
 """
+import asyncio
 import sendgrid
 from sendgrid.helpers.mail import Mail, Email, To, Content, Personalization
 from typing import List, Dict, Optional
@@ -31,6 +32,9 @@ class EmailService:
     Handles research digests, notifications, and alerts.
     """
 
+    # Digest emails in flight at once in send_batch_digest
+    MAX_CONCURRENT_SENDS = 32
+
     def __init__(self, config: EmailConfig):
         """
         Initialize email service.
@@ -70,7 +74,9 @@ class EmailService:
                 html_content=Content("text/html", html_content)
             )
 
-            response = self.client.send(message)
+            # The SendGrid client is blocking; keep it off the event loop
+            # so concurrent sends overlap
+            response = await asyncio.to_thread(self.client.send, message)
 
             if response.status_code in [200, 201, 202]:
                 logger.info(f"Email sent successfully to {to_email}")
@@ -126,27 +132,30 @@ class EmailService:
         """
         Send digest to multiple recipients.
 
+        Up to MAX_CONCURRENT_SENDS emails are sent concurrently.
+
         Args:
             recipients: List of dicts with to_email, user_name, papers, topic
 
         Returns:
             Dict with sent/failed counts
         """
-        sent = 0
-        failed = 0
-
-        for recipient in recipients:
-            success = await self.send_weekly_digest(
-                to_email=recipient["to_email"],
-                user_name=recipient["user_name"],
-                papers=recipient["papers"],
-                topic=recipient["topic"]
-            )
-
-            if success:
-                sent += 1
-            else:
-                failed += 1
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SENDS)
+
+        async def _send_one(recipient: Dict) -> bool:
+            async with semaphore:
+                return await self.send_weekly_digest(
+                    to_email=recipient["to_email"],
+                    user_name=recipient["user_name"],
+                    papers=recipient["papers"],
+                    topic=recipient["topic"]
+                )
+
+        results = await asyncio.gather(*[
+            _send_one(recipient) for recipient in recipients
+        ])
+        sent = sum(results)
+        failed = len(results) - sent
 
         logger.info(f"Batch digest: {sent} sent, {failed} failed")
 
@@ -31,16 +31,20 @@ class EmbeddingService:
     """
 
     EMBEDDING_MODEL = "mistral-embed"  # Mistral's embedding model
+    EMBEDDING_DIMENSION = 1024  # Output dimension of EMBEDDING_MODEL
     EMBEDDING_API_URL = "https://api.mistral.ai/v1/embeddings"
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, batch_size: int = 64):
         """
         Initialize embedding service.
 
         Args:
             api_key: Mistral API key
+            batch_size: Default number of texts per batch embedding request
         """
         self.api_key = api_key
+        self.batch_size = batch_size
+        self.dimension = self.EMBEDDING_DIMENSION
         self.client = httpx.AsyncClient(
             timeout=60.0,
             headers={
@@ -102,14 +106,14 @@ class EmbeddingService:
     async def generate_embeddings_batch(
         self,
         texts: List[str],
-        batch_size: int = 10
+        batch_size: Optional[int] = None
     ) -> List[EmbeddingResponse]:
         """
         Generate embeddings for multiple texts in batches.
 
         Args:
             texts: List of texts to embed
-            batch_size: Number of texts per batch (to avoid rate limits)
+            batch_size: Number of texts per batch (default: self.batch_size)
 
         Returns:
             List of embedding responses
@@ -117,6 +121,7 @@ class EmbeddingService:
         Note:
             Processes in batches to respect API rate limits.
         """
+        batch_size = batch_size or self.batch_size
         embeddings = []
 
         for i in range(0, len(texts), batch_size):
@@ -4,16 +4,23 @@ File ingestion service - processes uploaded files for RAG and chat context.
 Design Pattern: Facade Pattern + Strategy Pattern
 Purpose: Unified interface for file processing pipeline
 """
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Iterator, Tuple
 from dataclasses import dataclass
 from pathlib import Path
+from itertools import islice
+from collections import defaultdict
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 import logging
+import asyncio
 import hashlib
+import os
+import time
 from datetime import datetime
 
 from .document_parser import DocumentParser, ParsedDocument, DocumentParseError
-from .text_chunker import TextChunker
-from .embedding_service import EmbeddingService
+from .text_chunker import TextChunker, TextChunk
+from .embedding_service import EmbeddingService, EmbeddingResponse
 from .vector_db.base import VectorDatabaseInterface
 
 logger = logging.getLogger(__name__)
@@ -72,12 +79,22 @@ class FileIngestionService:
         )
     """
 
+    # Number of records sent to the vector database per upsert call
+    UPSERT_WINDOW_SIZE = 100
+
+    # Upper bounds (in estimated tokens) of the embedding length buckets
+    TOKEN_BUCKETS = (16, 32, 64, 128, 256, 512)
+
+    # Approximate number of tokens sent per embedding request
+    EMBEDDING_TOKEN_BUDGET = 4096
+
     def __init__(
         self,
         vector_db: VectorDatabaseInterface,
         embedding_service: EmbeddingService,
         parser: DocumentParser = None,
-        chunker: TextChunker = None
+        chunker: TextChunker = None,
+        parse_workers: Optional[int] = None
     ):
         """
         Initialize file ingestion service.
@@ -87,6 +104,7 @@ class FileIngestionService:
             embedding_service: Embedding generation service
             parser: Document parser (default: DocumentParser())
             chunker: Text chunker (default: TextChunker with fixed_size strategy)
+            parse_workers: Processes used for document parsing (default: CPU count)
         """
         self.vector_db = vector_db
         self.embedding_service = embedding_service
@@ -97,6 +115,12 @@ class FileIngestionService:
             overlap=50
         )
 
+        # PDF/DOCX parsing is pure-Python CPU work; a process pool lets
+        # concurrent uploads parse in parallel instead of contending for the GIL
+        self._parse_pool = ProcessPoolExecutor(
+            max_workers=parse_workers or os.cpu_count()
+        )
+
         logger.info("FileIngestionService initialized")
 
     async def ingest_file(
@@ -128,9 +152,11 @@ class FileIngestionService:
         file_id = self._generate_file_id(original_filename, conversation_id)
 
         try:
-            # Step 1: Parse document
+            # Step 1: Parse document (in the process pool, parsing is CPU-bound)
             logger.info(f"[{file_id}] Parsing file: {original_filename}")
-            parsed_doc = self.parser.parse(file_path)
+            parsed_doc = await asyncio.get_running_loop().run_in_executor(
+                self._parse_pool, self.parser.parse, file_path
+            )
 
             # Step 2: Build metadata
             metadata = {
@@ -147,7 +173,8 @@ class FileIngestionService:
             logger.info(
                 f"[{file_id}] Chunking text ({len(parsed_doc.content)} chars)"
             )
-            chunks = self.chunker.chunk_with_metadata_per_chunk(
+            chunks = await asyncio.to_thread(
+                self.chunker.chunk_with_metadata_per_chunk,
                 text=parsed_doc.content,
                 base_metadata=metadata,
                 document_id=file_id
@@ -163,10 +190,7 @@ class FileIngestionService:
                 f"[{file_id}] Generating embeddings for {len(chunks)} chunks"
             )
             chunk_texts = [chunk.content for chunk in chunks]
-            embeddings = await self.embedding_service.generate_embeddings_batch(
-                texts=chunk_texts,
-                batch_size=10
-            )
+            embeddings = await self._embed_bucketed(chunk_texts)
 
             if len(embeddings) != len(chunks):
                 raise Exception(
@@ -174,24 +198,23 @@ class FileIngestionService:
                 )
 
             # Step 5: Upload to vector database
+            # Records are produced lazily and upserted in fixed-size windows,
+            # so only one window of (id, vector, metadata) tuples is held at once
             logger.info(f"[{file_id}] Uploading to vector database")
-            chunk_ids = [f"{file_id}_chunk_{chunk.index}" for chunk in chunks]
-            vectors = [emb.embedding for emb in embeddings]
-
-            # Prepare metadata for vector DB
-            # Each chunk's metadata includes the actual text content
-            chunk_metadata = []
-            for chunk in chunks:
-                meta = chunk.metadata.copy()
-                meta['content'] = chunk.content  # Store content in metadata
-                meta['file_id'] = file_id  # Ensure file_id is in metadata
-                chunk_metadata.append(meta)
-
-            chunks_uploaded = await self.vector_db.upsert_vectors(
-                ids=chunk_ids,
-                vectors=vectors,
-                metadata=chunk_metadata
-            )
+            records = self._iter_records(chunks, embeddings, file_id)
+            chunks_uploaded = 0
+
+            while True:
+                window = list(islice(records, self.UPSERT_WINDOW_SIZE))
+                if not window:
+                    break
+
+                ids, vectors, chunk_metadata = zip(*window)
+                chunks_uploaded += await self.vector_db.upsert_vectors(
+                    ids=list(ids),
+                    vectors=list(vectors),
+                    metadata=list(chunk_metadata)
+                )
 
             logger.info(f"[{file_id}] Successfully ingested file")
 
@@ -222,6 +245,78 @@ class FileIngestionService:
                 error=str(e)
             )
 
+    async def _embed_bucketed(
+        self,
+        texts: List[str]
+    ) -> List[EmbeddingResponse]:
+        """
+        Generate embeddings with texts grouped into token-length buckets.
+
+        Texts of similar length are batched together and each bucket uses a
+        batch size sized to a fixed token budget, so short chunks go out in
+        large requests and long chunks don't pad out small ones.
+
+        Args:
+            texts: Chunk texts to embed
+
+        Returns:
+            Embeddings in the same order as texts
+        """
+        buckets = defaultdict(list)
+        for i, text in enumerate(texts):
+            # Rough token estimate: ~4 characters per token
+            tokens = len(text) // 4
+            buckets[bisect_right(self.TOKEN_BUCKETS, tokens)].append(i)
+
+        embeddings: List[Optional[EmbeddingResponse]] = [None] * len(texts)
+
+        for bucket, indices in buckets.items():
+            bucket_texts = [texts[i] for i in indices]
+            results = await self.embedding_service.generate_embeddings_batch(
+                texts=bucket_texts,
+                batch_size=self._bucket_batch_size(bucket)
+            )
+
+            # A failed batch is skipped by the embedding service, which would
+            # shift every later result onto the wrong chunk
+            if len(results) != len(indices):
+                raise Exception(
+                    f"Embedding count mismatch: {len(results)} != {len(indices)}"
+                )
+
+            for i, result in zip(indices, results):
+                embeddings[i] = result
+
+        return embeddings
+
+    def _bucket_batch_size(self, bucket: int) -> int:
+        """Batch size for a token bucket, keeping each request near the token budget."""
+        if bucket < len(self.TOKEN_BUCKETS):
+            max_tokens = self.TOKEN_BUCKETS[bucket]
+        else:
+            # Embedding inputs are truncated to 8000 chars (~2000 tokens)
+            max_tokens = 2000
+
+        return max(1, self.EMBEDDING_TOKEN_BUDGET // max_tokens)
+
+    def _iter_records(
+        self,
+        chunks: List[TextChunk],
+        embeddings: List[EmbeddingResponse],
+        file_id: str
+    ) -> Iterator[Tuple[str, List[float], Dict]]:
+        """
+        Yield (id, vector, metadata) records for upload, one chunk at a time.
+
+        Each chunk's metadata includes the actual text content and file_id.
+        """
+        for chunk, emb in zip(chunks, embeddings):
+            yield (
+                f"{file_id}_chunk_{chunk.index}",
+                emb.embedding,
+                {**chunk.metadata, 'content': chunk.content, 'file_id': file_id}
+            )
+
     async def delete_file(self, file_id: str) -> bool:
         """
         Delete all chunks from an uploaded file.
@@ -245,6 +340,10 @@ class FileIngestionService:
             logger.error(f"Failed to delete file {file_id}: {e}")
             return False
 
+    def close(self) -> None:
+        """Shut down the document parsing process pool."""
+        self._parse_pool.shutdown(wait=False, cancel_futures=True)
+
     def _generate_file_id(
         self,
         filename: str,
@@ -253,10 +352,11 @@ class FileIngestionService:
         """
         Generate a unique file ID from filename and timestamp.
 
-        Uses hash of filename + timestamp + conversation_id for uniqueness.
+        Uses hash of filename + nanosecond timestamp + conversation_id for
+        uniqueness. The timestamp is only a salt, so a raw integer is used
+        instead of formatting a datetime.
         """
-        timestamp = datetime.utcnow().isoformat()
-        hash_input = f"{filename}_{timestamp}_{conversation_id or ''}"
+        hash_input = f"{filename}_{time.time_ns()}_{conversation_id or ''}"
         hash_digest = hashlib.sha256(hash_input.encode()).hexdigest()[:12]
 
         # Clean filename for ID
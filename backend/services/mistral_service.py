@@ -4,6 +4,7 @@ Handles all interactions with the Mistral AI API.
 """
 import httpx
 import json
+import re
 from typing import AsyncGenerator, Optional, List, Dict
 from backend.config.settings import MistralConfig
 from backend.models.chat import StreamChunk
@@ -12,6 +13,36 @@ from backend.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Matches the content string of a streamed delta in Mistral's fixed chunk
+# schema, e.g. ..."delta":{"content":"Hello"}... so the common case skips
+# a full JSON parse of every SSE payload
+_DELTA_CONTENT_RE = re.compile(
+    r'"delta":\{"(?:role":"assistant","content":"|content":")((?:[^"\\]|\\.)*)"'
+)
+
+
+def _extract_delta_content(data_str: str) -> Optional[str]:
+    """
+    Extract delta content from an SSE payload without a full JSON parse.
+
+    Args:
+        data_str: JSON payload of a single SSE data line
+
+    Returns:
+        The decoded content string, or None if the payload doesn't match
+        the expected schema and must be parsed normally
+    """
+    match = _DELTA_CONTENT_RE.search(data_str)
+    if not match:
+        return None
+
+    content = match.group(1)
+    if "\\" in content:
+        # Only escaped strings need JSON string decoding
+        content = json.loads(f'"{content}"')
+
+    return content
+
 
 class MistralServiceError(Exception):
     """Custom exception for Mistral service errors."""
@@ -90,7 +121,8 @@ class MistralService:
                         f"API request failed with status {response.status_code}: {error_text.decode()}"
                     )
 
-                accumulated_content = ""
+                # Only the length is logged, so track that instead of the text
+                total_length = 0
 
                 async for line in response.aiter_lines():
                     if not line.strip():
@@ -110,27 +142,32 @@ class MistralService:
                             break
 
                         try:
-                            data = json.loads(data_str)
-                            choices = data.get("choices", [])
-
-                            if choices:
-                                delta = choices[0].get("delta", {})
-                                content = delta.get("content", "")
-
-                                if content:
-                                    accumulated_content += content
-                                    yield StreamChunk(
-                                        content=content,
-                                        is_final=False,
-                                        conversation_id=conversation_id,
-                                        message_id=message_id
-                                    )
+                            content = _extract_delta_content(data_str)
+
+                            if content is None:
+                                # Schema differs from the fast path; parse fully
+                                data = json.loads(data_str)
+                                choices = data.get("choices", [])
+                                content = ""
+
+                                if choices:
+                                    delta = choices[0].get("delta", {})
+                                    content = delta.get("content", "")
+
+                            if content:
+                                total_length += len(content)
+                                yield StreamChunk(
+                                    content=content,
+                                    is_final=False,
+                                    conversation_id=conversation_id,
+                                    message_id=message_id
+                                )
 
                         except json.JSONDecodeError as e:
                             logger.warning(f"Failed to parse JSON: {e} - Line: {data_str}")
                             continue
 
-                logger.info(f"Stream completed. Total content length: {len(accumulated_content)}")
+                logger.info(f"Stream completed. Total content length: {total_length}")
 
         except httpx.TimeoutException as e:
             logger.error(f"Request timeout: {e}")
@@ -142,6 +179,39 @@ class MistralService:
             logger.error(f"Unexpected error during streaming: {e}")
             raise MistralServiceError(f"Unexpected error: {str(e)}")
 
+    async def stream_response(self, prompt: str) -> AsyncGenerator[str, None]:
+        """
+        Stream the answer to a single-prompt request as raw text.
+
+        Content is yielded as soon as each SSE chunk arrives, without
+        buffering, so callers can forward tokens immediately.
+
+        Args:
+            prompt: Complete prompt sent as the user message
+
+        Yields:
+            Text chunks of the response
+        """
+        async for chunk in self.stream_chat_completion(
+            messages=[{"role": "user", "content": prompt}]
+        ):
+            if chunk.content:
+                yield chunk.content
+
+    async def generate_response(self, prompt: str) -> str:
+        """
+        Get the complete answer to a single-prompt request.
+
+        Args:
+            prompt: Complete prompt sent as the user message
+
+        Returns:
+            The complete response content
+        """
+        return await self.non_streaming_chat_completion(
+            messages=[{"role": "user", "content": prompt}]
+        )
+
     async def non_streaming_chat_completion(
         self,
         messages: List[Dict[str, str]],
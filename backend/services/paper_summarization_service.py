@@ -3,6 +3,7 @@ Paper summarization service using Mistral LLM.
 Generates concise summaries of academic papers for digests.
 """
 import httpx
+import json
 from typing import List, Dict, Optional
 import logging
 from dataclasses import dataclass
@@ -18,6 +19,8 @@ class PaperSummary:
     summary: str
     key_findings: List[str]
     relevance_score: float
+    # True when the LLM call failed and the summary is a truncated abstract
+    is_fallback: bool = False
 
     def to_dict(self) -> Dict:
         return {
@@ -36,7 +39,9 @@ class PaperSummarizationService:
     Generates concise summaries suitable for weekly digests.
     """
 
-    def __init__(self, api_key: str, model: str = "mistral-large-latest"):
+    DEFAULT_MODEL = "mistral-large-latest"
+
+    def __init__(self, api_key: str, model: str = DEFAULT_MODEL):
         """
         Initialize summarization service.
 
@@ -93,7 +98,9 @@ class PaperSummarizationService:
                     }
                 ],
                 "temperature": 0.3,  # Low temperature for factual summaries
-                "max_tokens": 500
+                "max_tokens": 500,
+                # Structured output: summary, findings and relevance in one pass
+                "response_format": {"type": "json_object"}
             }
 
             response = await self.client.post(
@@ -103,17 +110,14 @@ class PaperSummarizationService:
             response.raise_for_status()
 
             data = response.json()
-            summary_text = data["choices"][0]["message"]["content"]
-
-            # Parse the summary (extract key findings and relevance)
-            key_findings, relevance = self._parse_summary(summary_text)
+            result = json.loads(data["choices"][0]["message"]["content"])
 
             return PaperSummary(
                 paper_id="",  # Set by caller
                 title=title,
-                summary=summary_text,
-                key_findings=key_findings,
-                relevance_score=relevance
+                summary=result.get("summary", ""),
+                key_findings=result.get("key_findings", []),
+                relevance_score=float(result.get("relevance", 0.7))
             )
 
         except Exception as e:
@@ -124,7 +128,8 @@ class PaperSummarizationService:
                 title=title,
                 summary=abstract[:300] + "...",
                 key_findings=[],
-                relevance_score=0.5
+                relevance_score=0.5,
+                is_fallback=True
             )
 
     async def summarize_papers_batch(
@@ -242,38 +247,13 @@ Abstract:
             prompt += "\nNote: Emphasize relevance to these interests if applicable."
 
         prompt += "\n\nProvide a concise summary suitable for a research digest."
+        prompt += (
+            '\n\nRespond ONLY with JSON: {"summary": str, "key_findings": [str], '
+            '"relevance": float between 0 and 1}'
+        )
 
         return prompt
 
-    def _parse_summary(self, summary_text: str) -> tuple[List[str], float]:
-        """
-        Parse summary to extract key findings and relevance.
-
-        Args:
-            summary_text: Generated summary
-
-        Returns:
-            Tuple of (key_findings, relevance_score)
-        """
-        # Simple parsing - can be enhanced with structured output
-        key_findings = []
-        relevance_score = 0.7  # Default relevance
-
-        # Extract bullet points if present
-        lines = summary_text.split("\n")
-        for line in lines:
-            if line.strip().startswith(("-", "•", "*", "1.", "2.", "3.")):
-                finding = line.strip().lstrip("-•*123456789. ")
-                if finding:
-                    key_findings.append(finding)
-
-        # If no structured findings, use sentences
-        if not key_findings:
-            sentences = summary_text.split(". ")
-            key_findings = [s.strip() + "." for s in sentences[:3] if s.strip()]
-
-        return key_findings, relevance_score
-
     async def close(self):
         """Close the HTTP client."""
         await self.client.aclose()
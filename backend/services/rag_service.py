@@ -2,9 +2,17 @@
 RAG (Retrieval-Augmented Generation) service for answering questions about syllabi.
 Combines vector search with LLM generation for accurate, context-aware answers.
 """
-from typing import List, Optional, Dict
-from dataclasses import dataclass
+from typing import Any, List, Optional, Dict, Tuple
+from dataclasses import dataclass, replace
+from collections import OrderedDict
+import asyncio
+import functools
+import hashlib
 import logging
+import re
+import time
+
+import numpy as np
 
 from .vector_db.base import VectorDatabaseInterface, VectorSearchResult
 from .embedding_service import EmbeddingService
@@ -12,6 +20,52 @@ from .mistral_service import MistralService
 
 logger = logging.getLogger(__name__)
 
+# Course codes such as "CS101", "cs 101" or "MATH-2210A". Questions that
+# differ only in these embed almost identically, so they scope the answer cache
+_COURSE_CODE_RE = re.compile(r'\b([A-Za-z]{2,4})[\s-]?(\d{3,4}[A-Za-z]?)\b')
+
+# RAG prompt, filled in per question by RAGService._build_prompt
+_PROMPT_TMPL = """You are a helpful academic assistant that answers student questions about course syllabi.
+
+SYLLABI CONTENT:
+{context}
+
+STUDENT QUESTION{filter_context}:
+{question}
+
+INSTRUCTIONS:
+- Answer based ONLY on the provided syllabus content above
+- If the answer is not in the syllabi, say "I don't have that information in the available syllabi"
+- Be specific and cite which course/syllabus you're referencing when relevant
+- If multiple syllabi have different information, mention the differences
+- Be concise but complete
+- Use a helpful, professional tone
+
+ANSWER:"""
+
+
+@functools.lru_cache(maxsize=256)
+def _filter_context(items: Tuple[Tuple[str, Any], ...]) -> str:
+    """
+    Build the prompt's filter description from sorted filter items.
+
+    Cached per unique filter combination, which recurs across a chat session.
+    """
+    filters = dict(items)
+
+    filter_parts = []
+    if 'course_code' in filters:
+        filter_parts.append(f"course {filters['course_code']}")
+    if 'instructor' in filters:
+        filter_parts.append(f"instructor {filters['instructor']}")
+    if 'semester' in filters:
+        filter_parts.append(f"semester {filters['semester']}")
+
+    if not filter_parts:
+        return ""
+
+    return f"\n(Question is about {', '.join(filter_parts)})"
+
 
 @dataclass
 class RAGResponse:
@@ -30,6 +84,114 @@ class RAGResponse:
     metadata: Dict
 
 
+class _EmbedBatcher:
+    """
+    Coalesces concurrent query embeddings into batched API calls.
+
+    Each submitted question waits on a future while a background task drains
+    the queue, collecting up to max_batch questions or waiting at most
+    max_delay_ms for more, then embeds them in a single request.
+    """
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        max_batch: int = 32,
+        max_delay_ms: float = 10
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            embedding_service: Service used for batch embedding
+            max_batch: Maximum questions embedded per request
+            max_delay_ms: Maximum time to wait for a batch to fill
+        """
+        self.embedding_service = embedding_service
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, text: str) -> Optional[List[float]]:
+        """
+        Embed a text as part of the next batch.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector or None if embedding failed
+        """
+        # Started lazily so the queue and task bind to the running loop
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Drain the queue into batches until cancelled."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            await self._embed(batch)
+
+    async def _embed(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Embed one batch and resolve its futures."""
+        texts = [text for text, _ in batch]
+
+        try:
+            results = await self.embedding_service.generate_embeddings_batch(
+                texts=texts,
+                batch_size=len(texts)
+            )
+        except Exception as e:
+            logger.error(f"Batched query embedding failed: {e}")
+            results = []
+
+        # A failed request yields no results; callers treat None as failure
+        if len(results) != len(batch):
+            results = [None] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result.embedding if result else None)
+
+    async def aclose(self) -> None:
+        """Stop the background task, failing any questions still queued."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_result(None)
+
+
 class RAGService:
     """
     Retrieval-Augmented Generation service.
@@ -58,13 +220,35 @@ class RAGService:
             print(f"- {source.metadata['source_file']}")
     """
 
+    # Number of recent question embeddings kept (keyed by normalized text)
+    QUERY_EMBEDDING_CACHE_SIZE = 512
+
+    # Number of recent answers kept for semantic cache lookups
+    ANSWER_CACHE_SIZE = 128
+
+    # Minimum cosine similarity between questions to reuse a cached answer
+    ANSWER_CACHE_THRESHOLD = 0.95
+
+    # Seconds a cached answer may be served; bounds staleness from writes the
+    # vector DB's write_version can't see (e.g. another process ingesting)
+    ANSWER_CACHE_TTL = 300.0
+
+    # Per-stage timeouts (seconds) so a hung dependency can't wedge a request
+    EMBED_TIMEOUT = 5.0
+    SEARCH_TIMEOUT = 3.0
+
+    # Answer given without calling the LLM when retrieval finds nothing
+    NO_RESULTS_ANSWER = "I don't have that information in the available syllabi."
+
     def __init__(
         self,
         vector_db: VectorDatabaseInterface,
         embedding_service: EmbeddingService,
         mistral_service: MistralService,
         default_top_k: int = 5,
-        similarity_threshold: float = 0.7
+        similarity_threshold: float = 0.7,
+        max_context_tokens: int = 3000,
+        skip_llm_on_empty: bool = True
     ):
         """
         Initialize RAG service.
@@ -75,12 +259,31 @@ class RAGService:
             mistral_service: Service for generating answers
             default_top_k: Default number of chunks to retrieve
             similarity_threshold: Minimum similarity score to include
+            max_context_tokens: Maximum whitespace-delimited tokens of
+                                retrieved context sent to the LLM
+            skip_llm_on_empty: Answer with NO_RESULTS_ANSWER instead of
+                               calling the LLM when no chunks are retrieved
         """
         self.vector_db = vector_db
         self.embedding_service = embedding_service
         self.mistral_service = mistral_service
         self.default_top_k = default_top_k
         self.similarity_threshold = similarity_threshold
+        self.max_context_tokens = max_context_tokens
+        self.skip_llm_on_empty = skip_llm_on_empty
+
+        # Question text -> embedding, in least-recently-used order
+        self._query_emb_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+        # Unit-length question embeddings (one row per entry) and the
+        # (scope, expires_at, response) entries they map to. All entries were
+        # stored at vector DB write version _answer_cache_version
+        self._answer_cache_vectors: Optional[np.ndarray] = None
+        self._answer_cache_entries: List[Tuple[Tuple, float, RAGResponse]] = []
+        self._answer_cache_version = self.vector_db.write_version
+
+        # Concurrent questions share one embedding request
+        self._embed_batcher = _EmbedBatcher(embedding_service)
 
         logger.info("RAGService initialized")
 
@@ -120,37 +323,72 @@ class RAGService:
             )
         """
         try:
-            # Step 1: Embed the question
-            logger.info(f"Processing RAG query: {question[:100]}...")
-            query_embedding = await self.embedding_service.embed_query(question)
+            # Step 1: Embed the question, building the prompt's filter header
+            # while the embedding request is in flight
+            logger.debug("Processing RAG query: %.100s...", question)
+            embed_task = asyncio.create_task(
+                asyncio.wait_for(self._embed_question(question), self.EMBED_TIMEOUT)
+            )
+            filter_context = self._build_filter_context(filters)
+            query_embedding = await embed_task
 
-            if not query_embedding:
+            if query_embedding is None:
                 raise Exception("Failed to generate query embedding")
 
-            # Step 2: Search vector database
+            # Reuse the answer to a near-identical question asked recently
             top_k = top_k or self.default_top_k
-            search_results = await self.vector_db.search(
-                query_vector=query_embedding,
-                top_k=top_k,
-                filter=filters
+            cache_scope = self._answer_cache_scope(
+                question, top_k, filters, include_sources
             )
 
-            # Filter by similarity threshold
-            search_results = [
-                r for r in search_results
-                if r.similarity_score >= self.similarity_threshold
-            ]
+            cached = self._lookup_answer(query_embedding, cache_scope)
+            if cached:
+                logger.debug("Answer served from semantic cache")
+                return replace(
+                    cached,
+                    question=question,
+                    metadata={**cached.metadata, "cache_hit": True}
+                )
+
+            # Step 2: Search vector database, noting which writes the
+            # answer will reflect
+            write_version = self.vector_db.write_version
+            search_results = await asyncio.wait_for(
+                self.vector_db.search(
+                    query_vector=query_embedding,
+                    top_k=top_k,
+                    filter=filters,
+                    score_threshold=self.similarity_threshold
+                ),
+                self.SEARCH_TIMEOUT
+            )
 
-            logger.info(f"Retrieved {len(search_results)} relevant chunks")
+            logger.debug("Retrieved %d relevant chunks", len(search_results))
+
+            # Nothing to ground an answer in; the LLM would only decline
+            if not search_results and self.skip_llm_on_empty:
+                return RAGResponse(
+                    answer=self.NO_RESULTS_ANSWER,
+                    sources=[],
+                    question=question,
+                    metadata={
+                        "num_sources": 0,
+                        "filters_applied": filters or {},
+                        "top_k": top_k,
+                        "empty_retrieval": True
+                    }
+                )
 
             # Step 3: Build context from search results
             context = self._build_context(search_results)
 
             # Step 4: Build RAG prompt
-            prompt = self._build_prompt(question, context, filters)
+            prompt = self._build_prompt(
+                question, context, filters, filter_context=filter_context
+            )
 
             # Step 5: Generate answer
-            answer = await self._generate_answer(prompt)
+            answer, generated = await self._generate_answer(prompt)
 
             # Step 6: Build response
             response = RAGResponse(
@@ -164,9 +402,25 @@ class RAGService:
                 }
             )
 
-            logger.info(f"RAG query completed successfully")
+            # Failures are not cached, so the next similar question retries
+            if generated:
+                self._store_answer(
+                    query_embedding, cache_scope, response, write_version
+                )
+
+            logger.debug("RAG query completed successfully")
             return response
 
+        except asyncio.TimeoutError:
+            logger.error("RAG query timed out during retrieval")
+
+            return RAGResponse(
+                answer="The syllabus search took too long to respond. Please try again.",
+                sources=[],
+                question=question,
+                metadata={"error": "timeout"}
+            )
+
         except Exception as e:
             logger.error(f"RAG query failed: {e}", exc_info=True)
 
@@ -202,41 +456,207 @@ class RAGService:
             async for chunk in rag.stream_query("What is the grading policy?"):
                 print(chunk, end='', flush=True)
         """
+        start = time.perf_counter()
+
         try:
-            # Step 1-3: Same as regular query (retrieve and build context)
-            query_embedding = await self.embedding_service.embed_query(question)
+            # Step 1-3: Same as regular query (retrieve and build context).
+            # The prompt's filter header is built while the embedding is in flight
+            embed_task = asyncio.create_task(
+                asyncio.wait_for(self._embed_question(question), self.EMBED_TIMEOUT)
+            )
+            filter_context = self._build_filter_context(filters)
+            query_embedding = await embed_task
 
-            if not query_embedding:
+            if query_embedding is None:
                 yield "Error: Failed to generate query embedding"
                 return
 
             top_k = top_k or self.default_top_k
-            search_results = await self.vector_db.search(
-                query_vector=query_embedding,
-                top_k=top_k,
-                filter=filters
+            search_results = await asyncio.wait_for(
+                self.vector_db.search(
+                    query_vector=query_embedding,
+                    top_k=top_k,
+                    filter=filters,
+                    score_threshold=self.similarity_threshold
+                ),
+                self.SEARCH_TIMEOUT
             )
 
-            search_results = [
-                r for r in search_results
-                if r.similarity_score >= self.similarity_threshold
-            ]
+            if not search_results and self.skip_llm_on_empty:
+                yield self.NO_RESULTS_ANSWER
+                return
 
             context = self._build_context(search_results)
-            prompt = self._build_prompt(question, context, filters)
+            prompt = self._build_prompt(
+                question, context, filters, filter_context=filter_context
+            )
 
             # Step 4: Stream answer generation
+            first_token = True
             async for chunk in self.mistral_service.stream_response(prompt):
+                if first_token:
+                    first_token = False
+                    logger.debug(
+                        "Time to first token: %.3fs", time.perf_counter() - start
+                    )
                 yield chunk
 
+        except asyncio.TimeoutError:
+            logger.error("Streaming RAG query timed out during retrieval")
+            yield "Error: The syllabus search took too long to respond. Please try again."
+
         except Exception as e:
             logger.error(f"Streaming RAG query failed: {e}")
             yield f"\n\nError: {str(e)}"
 
+    async def _embed_question(self, question: str) -> Optional[np.ndarray]:
+        """
+        Embed a question, reusing the embedding of a recently seen question.
+
+        Questions are matched after stripping and lowercasing, so trivial
+        rephrasings of case or whitespace skip the embedding API call.
+        The vector is converted to a unit-length contiguous float32 array
+        once, and that same object is shared by the caches and the vector DB
+        search (for unit vectors, inner product equals cosine similarity).
+
+        Args:
+            question: User's question
+
+        Returns:
+            Unit-length embedding vector or None if embedding failed
+        """
+        key = hashlib.sha1(question.strip().lower().encode()).hexdigest()
+
+        embedding = self._query_emb_cache.get(key)
+        if embedding is not None:
+            self._query_emb_cache.move_to_end(key)
+            return embedding
+
+        embedding = await self._embed_batcher.submit(question)
+        if not embedding:
+            return None
+
+        embedding = np.ascontiguousarray(embedding, dtype=np.float32)
+        embedding /= np.linalg.norm(embedding) + 1e-12
+
+        self._query_emb_cache[key] = embedding
+        if len(self._query_emb_cache) > self.QUERY_EMBEDDING_CACHE_SIZE:
+            self._query_emb_cache.popitem(last=False)
+
+        return embedding
+
+    @staticmethod
+    def _answer_cache_scope(
+        question: str,
+        top_k: int,
+        filters: Optional[Dict],
+        include_sources: bool
+    ) -> Tuple:
+        """
+        Build the key a cached answer must match besides the question embedding.
+
+        Course codes mentioned in the question are part of the scope, since
+        "CS101 office hours" and "CS102 office hours" embed as near-duplicates.
+        """
+        course_codes = tuple(sorted({
+            (dept + num).upper() for dept, num in _COURSE_CODE_RE.findall(question)
+        }))
+        return (
+            top_k,
+            include_sources,
+            tuple(sorted((filters or {}).items())),
+            course_codes
+        )
+
+    def clear_answer_cache(self) -> None:
+        """Drop all cached answers."""
+        self._answer_cache_vectors = None
+        self._answer_cache_entries = []
+        self._answer_cache_version = self.vector_db.write_version
+
+    def _lookup_answer(
+        self,
+        query_embedding: np.ndarray,
+        scope: Tuple
+    ) -> Optional[RAGResponse]:
+        """
+        Find a cached answer for a semantically equivalent question.
+
+        Answers cached before the latest vector DB write, or older than
+        ANSWER_CACHE_TTL, are never returned.
+
+        Args:
+            query_embedding: Unit-length question embedding
+            scope: Answer cache scope from _answer_cache_scope
+
+        Returns:
+            Cached RAGResponse or None if no entry is similar enough
+        """
+        if self._answer_cache_version != self.vector_db.write_version:
+            # Syllabi were ingested or deleted; cached answers may be wrong
+            self.clear_answer_cache()
+
+        if self._answer_cache_vectors is None:
+            return None
+
+        now = time.monotonic()
+
+        # One matrix-vector product scores every cached question
+        scores = self._answer_cache_vectors @ query_embedding
+
+        for idx in np.argsort(scores)[::-1]:
+            if scores[idx] < self.ANSWER_CACHE_THRESHOLD:
+                break
+
+            cached_scope, expires_at, response = self._answer_cache_entries[idx]
+            if cached_scope == scope and expires_at > now:
+                return response
+
+        return None
+
+    def _store_answer(
+        self,
+        query_embedding: np.ndarray,
+        scope: Tuple,
+        response: RAGResponse,
+        write_version: int
+    ) -> None:
+        """
+        Add an answer to the semantic cache, evicting the oldest on overflow.
+
+        Args:
+            query_embedding: Unit-length question embedding
+            scope: Answer cache scope from _answer_cache_scope
+            response: Answer to cache
+            write_version: Vector DB write_version the answer was retrieved at
+        """
+        if write_version != self.vector_db.write_version:
+            # Syllabi changed while the answer was being generated
+            return
+        if self._answer_cache_version != write_version:
+            self.clear_answer_cache()
+
+        row = query_embedding[np.newaxis, :]
+
+        if self._answer_cache_vectors is None:
+            self._answer_cache_vectors = row
+        else:
+            self._answer_cache_vectors = np.vstack([self._answer_cache_vectors, row])
+        self._answer_cache_entries.append(
+            (scope, time.monotonic() + self.ANSWER_CACHE_TTL, response)
+        )
+
+        if len(self._answer_cache_entries) > self.ANSWER_CACHE_SIZE:
+            self._answer_cache_vectors = self._answer_cache_vectors[1:]
+            self._answer_cache_entries.pop(0)
+
     def _build_context(self, search_results: List[VectorSearchResult]) -> str:
         """
         Build context string from search results.
 
+        Chunks with identical content are included once, and the total
+        context is truncated to max_context_tokens.
+
         Format:
             [Source 1: CS101_Fall2024.pdf]
             Course grading policy: Exams 40%, Projects 60%...
@@ -254,33 +674,62 @@ class RAGService:
             return "No relevant information found in the syllabi."
 
         context_parts = []
-
-        for i, result in enumerate(search_results, 1):
-            source_file = result.metadata.get('source_file', 'Unknown')
-            course_code = result.metadata.get('course_code', '')
-            semester = result.metadata.get('semester', '')
-
-            # Build source header
-            source_header = f"[Source {i}: {source_file}"
+        seen = set()
+        tokens_left = self.max_context_tokens
+
+        for result in search_results:
+            # A previous chunk used up the budget exactly
+            if tokens_left <= 0:
+                break
+
+            # The same chunk often recurs across semesters of a course
+            digest = hashlib.blake2b(
+                result.content.encode(), digest_size=16
+            ).digest()
+            if digest in seen:
+                continue
+            seen.add(digest)
+
+            content = result.content
+            words = content.split()
+            truncated = len(words) > tokens_left
+            if truncated:
+                content = " ".join(words[:tokens_left]) + "...[truncated]"
+            tokens_left -= len(words)
+
+            i = len(context_parts) + 1
+            metadata = result.metadata
+            source_file = metadata.get('source_file', 'Unknown')
+            course_code = metadata.get('course_code', '')
+            semester = metadata.get('semester', '')
+
+            # Course suffix for the source header, e.g. " (CS101, Fall 2024)"
             if course_code:
-                source_header += f" ({course_code}"
-                if semester:
-                    source_header += f", {semester}"
-                source_header += ")"
-            source_header += "]"
+                code_str = (
+                    f" ({course_code}, {semester})" if semester
+                    else f" ({course_code})"
+                )
+            else:
+                code_str = ""
 
-            # Add source and content
             context_parts.append(
-                f"{source_header}\n{result.content}\n"
+                f"[Source {i}: {source_file}{code_str}]\n{content}\n"
             )
 
+            if truncated:
+                break
+
+        if not context_parts:
+            return "No relevant information found in the syllabi."
+
         return "\n---\n".join(context_parts)
 
     def _build_prompt(
         self,
         question: str,
         context: str,
-        filters: Optional[Dict] = None
+        filters: Optional[Dict] = None,
+        filter_context: Optional[str] = None
     ) -> str:
         """
         Build RAG prompt for the LLM.
@@ -295,45 +744,42 @@ class RAGService:
             question: User's question
             context: Retrieved context from vector search
             filters: Applied filters (for context)
+            filter_context: Precomputed output of _build_filter_context
 
         Returns:
             Complete prompt string
         """
-        # Add filter context if applicable
-        filter_context = ""
-        if filters:
-            filter_parts = []
-            if 'course_code' in filters:
-                filter_parts.append(f"course {filters['course_code']}")
-            if 'instructor' in filters:
-                filter_parts.append(f"instructor {filters['instructor']}")
-            if 'semester' in filters:
-                filter_parts.append(f"semester {filters['semester']}")
-
-            if filter_parts:
-                filter_context = f"\n(Question is about {', '.join(filter_parts)})"
-
-        prompt = f"""You are a helpful academic assistant that answers student questions about course syllabi.
+        if filter_context is None:
+            filter_context = self._build_filter_context(filters)
 
-SYLLABI CONTENT:
-{context}
+        return _PROMPT_TMPL.format(
+            context=context,
+            filter_context=filter_context,
+            question=question
+        )
 
-STUDENT QUESTION{filter_context}:
-{question}
+    @staticmethod
+    def _build_filter_context(filters: Optional[Dict]) -> str:
+        """
+        Describe applied filters for the prompt's question header.
 
-INSTRUCTIONS:
-- Answer based ONLY on the provided syllabus content above
-- If the answer is not in the syllabi, say "I don't have that information in the available syllabi"
-- Be specific and cite which course/syllabus you're referencing when relevant
-- If multiple syllabi have different information, mention the differences
-- Be concise but complete
-- Use a helpful, professional tone
+        Args:
+            filters: Applied metadata filters
 
-ANSWER:"""
+        Returns:
+            Filter description line, or empty string if no known filters
+        """
+        if not filters:
+            return ""
 
-        return prompt
+        items = tuple(sorted(filters.items()))
+        try:
+            return _filter_context(items)
+        except TypeError:
+            # Operator filters (e.g. {"$in": [...]}) aren't hashable
+            return _filter_context.__wrapped__(items)
 
-    async def _generate_answer(self, prompt: str) -> str:
+    async def _generate_answer(self, prompt: str) -> Tuple[str, bool]:
         """
         Generate answer using Mistral LLM.
 
@@ -341,18 +787,17 @@ ANSWER:"""
             prompt: Complete RAG prompt
 
         Returns:
-            Generated answer
+            Tuple of (answer, generated); on failure the answer is an error
+            message and generated is False
         """
         try:
-            # Use the existing Mistral service to generate response
-            # Assuming MistralService has a method like this
             response = await self.mistral_service.generate_response(prompt)
 
-            return response
+            return response, True
 
         except Exception as e:
             logger.error(f"Failed to generate answer: {e}")
-            return f"I encountered an error while generating the answer: {str(e)}"
+            return f"I encountered an error while generating the answer: {str(e)}", False
 
     async def get_relevant_courses(
         self,
@@ -385,24 +830,29 @@ ANSWER:"""
                 top_k=top_k
             )
 
-            # Extract unique courses
-            courses_seen = set()
-            courses = []
+            # Extract unique courses (first, i.e. most relevant, result wins)
+            courses: Dict[str, Dict] = {}
 
             for result in results:
-                course_code = result.metadata.get('course_code')
-                if course_code and course_code not in courses_seen:
-                    courses_seen.add(course_code)
-                    courses.append({
-                        'course_code': course_code,
-                        'source_file': result.metadata.get('source_file'),
-                        'instructor': result.metadata.get('instructor'),
-                        'semester': result.metadata.get('semester'),
-                        'relevance_score': result.similarity_score
-                    })
-
-            return courses
+                md = result.metadata
+                course_code = md.get('course_code')
+                if not course_code or course_code in courses:
+                    continue
+
+                courses[course_code] = {
+                    'course_code': course_code,
+                    'source_file': md.get('source_file'),
+                    'instructor': md.get('instructor'),
+                    'semester': md.get('semester'),
+                    'relevance_score': result.similarity_score
+                }
+
+            return list(courses.values())
 
         except Exception as e:
             logger.error(f"Failed to get relevant courses: {e}")
             return []
+
+    async def aclose(self) -> None:
+        """Stop the query embedding batcher."""
+        await self._embed_batcher.aclose()
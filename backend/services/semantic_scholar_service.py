@@ -3,7 +3,16 @@ Semantic Scholar API integration service.
 Fetches academic papers with metadata, abstracts, and citations.
 """
 import httpx
-from typing import List, Dict, Optional, AsyncGenerator
+import asyncio
+import hashlib
+import heapq
+import orjson
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Optional, AsyncGenerator, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 import logging
@@ -56,24 +65,137 @@ class SemanticScholarService:
 
     BASE_URL = "https://api.semanticscholar.org/graph/v1"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Maximum concurrent API requests (keeps bursts within the rate limit)
+    MAX_CONCURRENT_REQUESTS = 5
+
+    # Response cache lifetimes (seconds)
+    SEARCH_CACHE_TTL = 86400  # 24 hours
+    PAPER_CACHE_TTL = 604800  # 7 days
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_path: Optional[str] = None
+    ):
         """
         Initialize Semantic Scholar service.
 
         Args:
             api_key: Optional API key for higher rate limits
+            cache_path: SQLite file for cached API responses (defaults to
+                        SEMANTIC_SCHOLAR_CACHE_PATH env var; caching is off
+                        if unset)
         """
-        headers = {}
+        headers = {"accept-encoding": "gzip"}
         if api_key:
             headers["x-api-key"] = api_key
 
+        # HTTP/2 multiplexes the get_recent_papers fan-out over one connection
         self.client = httpx.AsyncClient(
             base_url=self.BASE_URL,
             headers=headers,
             timeout=30.0,
-            follow_redirects=True
+            follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=50,
+                max_keepalive_connections=20,
+                keepalive_expiry=60.0
+            )
         )
 
+        self._sem = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        # The connection is used from worker threads, one at a time
+        self._cache_lock = threading.Lock()
+        self._cache: Optional[sqlite3.Connection] = None
+        cache_path = cache_path or os.getenv("SEMANTIC_SCHOLAR_CACHE_PATH")
+        if cache_path:
+            self._cache = self._open_cache(cache_path)
+
+    @staticmethod
+    def _open_cache(cache_path: str) -> Optional[sqlite3.Connection]:
+        """Open (creating if needed) the response cache database."""
+        try:
+            cache_path = os.path.expanduser(cache_path)
+            Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+            # Several worker processes may share the file: WAL lets readers
+            # run alongside a writer, and the timeout waits out brief locks
+            conn = sqlite3.connect(cache_path, timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, expires_at REAL, data BLOB)"
+            )
+            return conn
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache disabled, failed to open {cache_path}: {e}")
+            return None
+
+    def _read_cache(self, key: str) -> Optional[bytes]:
+        """Fetch an unexpired cached response; cache errors count as misses."""
+        try:
+            with self._cache_lock:
+                row = self._cache.execute(
+                    "SELECT data FROM responses WHERE key = ? AND expires_at > ?",
+                    (key, time.time())
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+        return row[0] if row else None
+
+    def _write_cache(self, key: str, data: bytes, ttl: int) -> None:
+        """Store a response; cache errors are logged and otherwise ignored."""
+        try:
+            with self._cache_lock:
+                self._cache.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                    (key, time.time() + ttl, data)
+                )
+                self._cache.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache write failed: {e}")
+
+    async def _get_cached(self, path: str, params: Dict, ttl: int) -> Any:
+        """
+        GET a JSON endpoint, serving repeat requests from the response cache.
+
+        Args:
+            path: API path relative to BASE_URL
+            params: Query parameters
+            ttl: Seconds a cached response stays valid
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status
+        """
+        key = None
+        if self._cache:
+            key = hashlib.blake2b(
+                orjson.dumps([path, sorted(params.items())])
+            ).hexdigest()
+
+            # SQLite blocks, so cache I/O stays off the event loop
+            cached = await asyncio.to_thread(self._read_cache, key)
+            if cached is not None:
+                return orjson.loads(cached)
+
+        async with self._sem:
+            response = await self.client.get(path, params=params)
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+
+        if key:
+            await asyncio.to_thread(
+                self._write_cache, key, orjson.dumps(data), ttl
+            )
+
+        return data
+
     async def search_papers(
         self,
         query: str,
@@ -116,18 +238,12 @@ class SemanticScholarService:
             if fields_of_study:
                 params["fieldsOfStudy"] = ",".join(fields_of_study)
 
-            response = await self.client.get("/paper/search", params=params)
-            response.raise_for_status()
-
-            data = response.json()
-            papers = []
-
-            for item in data.get("data", []):
-                paper = self._parse_paper(item)
-                if paper:
-                    papers.append(paper)
+            data = await self._get_cached(
+                "/paper/search", params, self.SEARCH_CACHE_TTL
+            )
+            papers = [self._parse_paper(item) for item in data.get("data") or []]
 
-            logger.info(f"Found {len(papers)} papers for query: {query}")
+            logger.debug("Found %d papers for query: %s", len(papers), query)
             return papers
 
         except httpx.HTTPStatusError as e:
@@ -137,6 +253,59 @@ class SemanticScholarService:
             logger.error(f"Unexpected error searching papers: {e}")
             raise SemanticScholarServiceError(f"Search failed: {e}")
 
+    async def search_papers_multi(
+        self,
+        fields_of_study: List[str],
+        year: Optional[str] = None,
+        limit: int = 100
+    ) -> Tuple[List[PaperMetadata], List[str]]:
+        """
+        Search several fields of study at once.
+
+        Each field is searched with its name as the query, all concurrently
+        over the shared client, so the total wait is about one round-trip.
+
+        Args:
+            fields_of_study: Fields to search
+            year: Filter by year or year range (e.g., "2023" or "2020-2023")
+            limit: Maximum number of results per field (max 100)
+
+        Returns:
+            Tuple of (combined papers, deduplicated with the first occurrence
+            kept; fields whose search failed)
+
+        Raises:
+            SemanticScholarServiceError: If every field's search failed
+        """
+        results = await asyncio.gather(
+            *[
+                self.search_papers(
+                    query=field,
+                    year=year,
+                    fields_of_study=[field],
+                    limit=limit
+                )
+                for field in fields_of_study
+            ],
+            return_exceptions=True
+        )
+
+        unique_papers: Dict[str, PaperMetadata] = {}
+        failed_fields = []
+        for field, papers in zip(fields_of_study, results):
+            if isinstance(papers, Exception):
+                logger.error(f"Failed to search papers for {field}: {papers}")
+                failed_fields.append(field)
+                continue
+
+            for p in papers:
+                unique_papers.setdefault(p.paper_id, p)
+
+        if fields_of_study and len(failed_fields) == len(fields_of_study):
+            raise SemanticScholarServiceError("Search failed for every field")
+
+        return list(unique_papers.values()), failed_fields
+
     async def get_paper_details(self, paper_id: str) -> Optional[PaperMetadata]:
         """
         Get detailed information about a specific paper.
@@ -152,10 +321,9 @@ class SemanticScholarService:
                 "fields": "paperId,title,abstract,authors,year,venue,citationCount,url,publicationDate,fieldsOfStudy,citations,references"
             }
 
-            response = await self.client.get(f"/paper/{paper_id}", params=params)
-            response.raise_for_status()
-
-            data = response.json()
+            data = await self._get_cached(
+                f"/paper/{paper_id}", params, self.PAPER_CACHE_TTL
+            )
             return self._parse_paper(data)
 
         except httpx.HTTPStatusError as e:
@@ -189,68 +357,71 @@ class SemanticScholarService:
 
         year_range = f"{start_date.year}-{end_date.year}"
 
-        all_papers = []
-        for field in fields_of_study:
-            papers = await self.search_papers(
-                query=field,
-                year=year_range,
-                fields_of_study=[field],
-                limit=limit
-            )
+        # ISO dates order lexicographically, so the cutoff is compared as text
+        cutoff_str = start_date.strftime("%Y-%m-%d")
 
-            # Filter by date and citations
-            filtered = [
+        try:
+            papers, _ = await self.search_papers_multi(
+                fields_of_study, year=year_range, limit=limit
+            )
+        except SemanticScholarServiceError:
+            # Every field failed; already logged per field
+            return []
+
+        # Top papers by citation count without sorting the full list
+        return heapq.nlargest(
+            limit,
+            (
                 p for p in papers
                 if p.citation_count >= min_citations
-                and self._is_recent(p.published_date, days_back)
-            ]
+                and self._is_recent(p.published_date, cutoff_str)
+            ),
+            key=lambda x: x.citation_count
+        )
 
-            all_papers.extend(filtered)
+    def _parse_paper(self, data: Dict) -> PaperMetadata:
+        """
+        Parse API response into PaperMetadata.
 
-        # Remove duplicates and sort by citation count
-        unique_papers = {p.paper_id: p for p in all_papers}.values()
-        sorted_papers = sorted(
-            unique_papers,
-            key=lambda x: x.citation_count,
-            reverse=True
+        Every field falls back to a default, so parsing never raises on
+        missing or null values.
+        """
+        return PaperMetadata(
+            paper_id=data.get("paperId") or "",
+            title=data.get("title") or "",
+            abstract=data.get("abstract"),
+            authors=[
+                author.get("name") or "Unknown"
+                for author in data.get("authors") or []
+            ],
+            year=data.get("year"),
+            venue=data.get("venue"),
+            citation_count=data.get("citationCount") or 0,
+            url=data.get("url") or "",
+            published_date=data.get("publicationDate"),
+            fields_of_study=data.get("fieldsOfStudy") or []
         )
 
-        return sorted_papers[:limit]
-
-    def _parse_paper(self, data: Dict) -> Optional[PaperMetadata]:
-        """Parse API response into PaperMetadata."""
-        try:
-            return PaperMetadata(
-                paper_id=data.get("paperId", ""),
-                title=data.get("title", ""),
-                abstract=data.get("abstract"),
-                authors=[
-                    author.get("name", "Unknown")
-                    for author in data.get("authors", [])
-                ],
-                year=data.get("year"),
-                venue=data.get("venue"),
-                citation_count=data.get("citationCount", 0),
-                url=data.get("url", ""),
-                published_date=data.get("publicationDate"),
-                fields_of_study=data.get("fieldsOfStudy", [])
-            )
-        except Exception as e:
-            logger.warning(f"Failed to parse paper: {e}")
-            return None
+    def _is_recent(self, published_date: Optional[str], cutoff_str: str) -> bool:
+        """
+        Check if paper was published on or after the cutoff date.
 
-    def _is_recent(self, published_date: Optional[str], days_back: int) -> bool:
-        """Check if paper was published within the last N days."""
-        if not published_date:
-            return False
+        Args:
+            published_date: Publication date as YYYY-MM-DD
+            cutoff_str: Earliest accepted date as YYYY-MM-DD
 
-        try:
-            pub_date = datetime.strptime(published_date, "%Y-%m-%d")
-            cutoff = datetime.now() - timedelta(days=days_back)
-            return pub_date >= cutoff
-        except ValueError:
-            return False
+        Returns:
+            True if the date is well-formed and not before the cutoff
+        """
+        return (
+            published_date is not None
+            and len(published_date) >= 10
+            and published_date[:10] >= cutoff_str
+        )
 
     async def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP client and response cache."""
         await self.client.aclose()
+        if self._cache:
+            with self._cache_lock:
+                self._cache.close()
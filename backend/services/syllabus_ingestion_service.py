@@ -2,20 +2,31 @@
 Syllabus ingestion service - orchestrates the document processing pipeline.
 Takes PDFs from disk, processes them, and uploads to vector database.
 """
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple, Literal
 from dataclasses import dataclass
 from pathlib import Path
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
 import logging
 import asyncio
+import os
+import random
+
+import numpy as np
 from tqdm import tqdm
 
 from .document_parser import DocumentParser, ParsedDocument, DocumentParseError
 from .text_chunker import TextChunker, TextChunk
-from .embedding_service import EmbeddingService
+from .embedding_service import EmbeddingService, EmbeddingResponse
 from .vector_db.base import VectorDatabaseInterface
 
 logger = logging.getLogger(__name__)
 
+# Characters normalized to underscores in document IDs
+_DOC_ID_TRANS = str.maketrans({' ': '_', '-': '_'})
+
 
 @dataclass
 class IngestionResult:
@@ -30,6 +41,7 @@ class IngestionResult:
         chunks_uploaded: Number of chunks uploaded to vector DB
         metadata: Document metadata extracted
         error: Error message if failed
+        skipped: Whether the file was unchanged since it was last ingested
     """
     success: bool
     document_id: str
@@ -38,6 +50,7 @@ class IngestionResult:
     chunks_uploaded: int = 0
     metadata: Optional[Dict] = None
     error: Optional[str] = None
+    skipped: bool = False
 
 
 @dataclass
@@ -50,12 +63,16 @@ class BatchIngestionResult:
         successful: Number of files successfully ingested
         failed: Number of files that failed
         total_chunks: Total chunks created
+        skipped: Number of files skipped as unchanged (not counted as successful)
         results: Individual results for each file
     """
+    __slots__ = ('total_files', 'successful', 'failed', 'total_chunks', 'skipped', 'results')
+
     total_files: int
     successful: int
     failed: int
     total_chunks: int
+    skipped: int
     results: List[IngestionResult]
 
 
@@ -85,12 +102,32 @@ class SyllabusIngestionService:
         print(f"Created {result.chunks_created} chunks")
     """
 
+    # Maximum embedding batch requests in flight at once
+    MAX_INFLIGHT_BATCHES = 5
+
+    # Maximum vector upsert requests in flight at once
+    MAX_CONCURRENT_UPSERTS = 4
+
+    # Vector encodings supported for upload
+    EMBEDDING_DTYPES = ('float32', 'int8')
+
+    # Content hashes of ingested files, kept across runs. Entries are scoped
+    # by target index, chunker settings, embedding model and dtype, so one
+    # file can be shared by every configuration and process
+    DEFAULT_CACHE_PATH = str(Path.home() / ".cache" / "syllabus_ingest.json")
+
     def __init__(
         self,
         vector_db: VectorDatabaseInterface,
         embedding_service: EmbeddingService,
         parser: DocumentParser = None,
-        chunker: TextChunker = None
+        chunker: TextChunker = None,
+        parse_workers: Optional[int] = None,
+        upsert_batch_size: int = 100,
+        embedding_dtype: Literal['float32', 'int8'] = 'float32',
+        chunk_window: Optional[int] = None,
+        chunk_stride: Optional[int] = None,
+        cache_path: Optional[str] = DEFAULT_CACHE_PATH
     ):
         """
         Initialize ingestion service.
@@ -99,30 +136,208 @@ class SyllabusIngestionService:
             vector_db: Vector database adapter
             embedding_service: Embedding generation service
             parser: Document parser (default: DocumentParser())
-            chunker: Text chunker (default: TextChunker with fixed_size strategy)
+            chunker: Text chunker (default: TextChunker with fixed_size strategy,
+                     or sliding_window if chunk_window is given)
+            parse_workers: Processes used for document parsing (default: CPU
+                           count); sized independently of max_concurrent_files
+            upsert_batch_size: Vectors sent to the vector database per upsert call
+            embedding_dtype: 'int8' quantizes vectors before upload, storing each
+                             vector's scale in its metadata; only suitable for
+                             cosine indexes, where the scale doesn't matter
+            chunk_window: Window size for a default sliding_window chunker;
+                          ignored when a chunker is passed
+            chunk_stride: Stride for that chunker (default: 75% of the window);
+                          smaller strides trade index size for recall
+            cache_path: JSON file of content hashes used to skip files that
+                        are unchanged since they were ingested with the same
+                        configuration (None disables the cache)
+
+        Raises:
+            ValueError: If embedding_dtype is not supported, or is 'int8'
+                        with a vector database that doesn't use cosine
         """
+        if embedding_dtype not in self.EMBEDDING_DTYPES:
+            raise ValueError(
+                f"Unsupported embedding dtype: {embedding_dtype}. "
+                f"Supported dtypes: {', '.join(self.EMBEDDING_DTYPES)}"
+            )
+
+        # Quantized vectors are scaled per vector, which only cosine
+        # similarity ignores; dot product and euclidean scores would be wrong
+        metric = getattr(vector_db, 'metric', 'cosine')
+        if embedding_dtype == 'int8' and metric != 'cosine':
+            raise ValueError(
+                f"embedding_dtype 'int8' requires a cosine index, "
+                f"but the vector database uses '{metric}'"
+            )
+
         self.vector_db = vector_db
         self.embedding_service = embedding_service
         self.parser = parser or DocumentParser()
+        if chunker is None and chunk_window is not None:
+            chunker = TextChunker(
+                strategy='sliding_window',
+                window=chunk_window,
+                stride=chunk_stride
+            )
         self.chunker = chunker or TextChunker(
             strategy='fixed_size',
             chunk_size=500,
             overlap=50
         )
+        self.upsert_batch_size = upsert_batch_size
+        self.embedding_dtype = embedding_dtype
+        self._expected_dim = getattr(embedding_service, 'dimension', None)
+
+        # Parsing is CPU-bound pure Python, so it runs in worker processes
+        # rather than threads that would contend for the GIL
+        self._parse_pool = ProcessPoolExecutor(
+            max_workers=parse_workers or os.cpu_count()
+        )
+
+        # "<config scope>:<document_id>" -> sha256 of the file content last
+        # ingested under it, plus this instance's changes not yet saved
+        # (None marks a removal)
+        self.cache_path = cache_path
+        self._cache_scope = self._config_fingerprint()
+        self._content_cache: Dict[str, str] = self._load_content_cache(cache_path)
+        self._cache_updates: Dict[str, Optional[str]] = {}
 
         logger.info("SyllabusIngestionService initialized")
 
+    @staticmethod
+    def _load_content_cache(cache_path: Optional[str]) -> Dict[str, str]:
+        """Load the content hash cache, starting empty if it can't be read."""
+        if not cache_path or not os.path.exists(cache_path):
+            return {}
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable ingestion cache {cache_path}: {e}")
+            return {}
+
+    def _save_content_cache(self) -> None:
+        """
+        Persist this instance's cache changes, replacing the file atomically.
+
+        Changes are merged into the file's current contents rather than
+        overwriting it, so other processes' entries survive.
+        """
+        if not self.cache_path or not self._cache_updates:
+            return
+        try:
+            merged = self._load_content_cache(self.cache_path)
+            for key, content_hash in self._cache_updates.items():
+                if content_hash is None:
+                    merged.pop(key, None)
+                else:
+                    merged[key] = content_hash
+
+            Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(merged, f)
+            os.replace(tmp_path, self.cache_path)
+
+            self._content_cache = merged
+            self._cache_updates.clear()
+        except OSError as e:
+            logger.warning(f"Failed to save ingestion cache {self.cache_path}: {e}")
+
+    def _config_fingerprint(self) -> str:
+        """
+        Fingerprint everything besides file content that shapes the uploaded vectors.
+
+        Re-ingesting into another index, or with a different chunker or
+        encoding, must not be skipped just because the file is unchanged.
+        """
+        strategy = getattr(self.chunker, 'strategy', None)
+        strategy_params = sorted(
+            (name, value) for name, value in vars(strategy or object()).items()
+            if isinstance(value, (int, float, str, bool))
+        )
+        config = [
+            type(self.vector_db).__name__,
+            getattr(self.vector_db, 'index_name', None),
+            getattr(self.chunker, 'strategy_name', type(self.chunker).__name__),
+            strategy_params,
+            self.embedding_dtype,
+            getattr(self.embedding_service, 'model', None)
+            or getattr(self.embedding_service, 'EMBEDDING_MODEL', None)
+        ]
+        return hashlib.sha256(
+            json.dumps(config, default=str).encode()
+        ).hexdigest()[:16]
+
+    def _cache_key(self, document_id: str) -> str:
+        """Key of a document's content hash under the current configuration."""
+        return f"{self._cache_scope}:{document_id}"
+
+    def _record_ingested(self, document_id: str, content_hash: str) -> None:
+        """Remember the content hash a document was just ingested with."""
+        key = self._cache_key(document_id)
+        self._content_cache[key] = content_hash
+        self._cache_updates[key] = content_hash
+
+    @staticmethod
+    def _hash_file(file_path: str) -> str:
+        """Compute the sha256 of a file, reading it in 1MB blocks."""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    async def _unchanged_result(
+        self,
+        document_id: str,
+        file_path: str
+    ) -> Tuple[str, Optional[IngestionResult]]:
+        """
+        Hash a file and check it against the content cache.
+
+        Returns:
+            Tuple of the file's hash and, if the file is unchanged since it
+            was last ingested, a skipped IngestionResult (otherwise None)
+        """
+        content_hash = await asyncio.to_thread(self._hash_file, file_path)
+        if self._content_cache.get(self._cache_key(document_id)) != content_hash:
+            return content_hash, None
+
+        logger.info(f"[{document_id}] Unchanged since last ingestion, skipping")
+        return content_hash, IngestionResult(
+            success=True,
+            document_id=document_id,
+            file_path=file_path,
+            skipped=True
+        )
+
+    async def ensure_ready(self) -> None:
+        """
+        Initialize the vector database, checking it against the embedding dimension.
+
+        Raises:
+            VectorDatabaseError: If initialization fails or dimensions differ
+        """
+        await self.vector_db.initialize(expected_dim=self._expected_dim)
+
     async def ingest_file(
         self,
         file_path: str,
-        additional_metadata: Optional[Dict] = None
+        additional_metadata: Optional[Dict] = None,
+        force: bool = False
     ) -> IngestionResult:
         """
         Ingest a single syllabus file.
 
+        Files whose content hash matches the last successful ingestion under
+        the same document ID are skipped unless force is set.
+
         Args:
             file_path: Path to the syllabus file
             additional_metadata: Additional metadata to attach (course_code, etc.)
+            force: Re-ingest even if the file is unchanged
 
         Returns:
             IngestionResult with processing details
@@ -136,60 +351,29 @@ class SyllabusIngestionService:
         document_id = self._generate_document_id(file_path)
 
         try:
-            # Step 1: Parse document
-            logger.info(f"[{document_id}] Parsing document: {file_path}")
-            parsed_doc = self.parser.parse(file_path)
-
-            # Step 2: Merge metadata
-            metadata = {
-                **parsed_doc.metadata,
-                **(additional_metadata or {})
-            }
-
-            # Step 3: Chunk text
-            logger.info(f"[{document_id}] Chunking text ({len(parsed_doc.content)} chars)")
-            chunks = self.chunker.chunk_with_metadata_per_chunk(
-                text=parsed_doc.content,
-                base_metadata=metadata,
-                document_id=document_id
-            )
+            content_hash, skipped = await self._unchanged_result(document_id, file_path)
+            if skipped and not force:
+                return skipped
 
-            if not chunks:
-                raise Exception("No chunks created from document")
-
-            logger.info(f"[{document_id}] Created {len(chunks)} chunks")
+            # Steps 1-3: Parse, merge metadata, chunk
+            metadata, chunks = await self._parse_and_chunk(
+                file_path, document_id, additional_metadata
+            )
 
             # Step 4: Generate embeddings
             logger.info(f"[{document_id}] Generating embeddings for {len(chunks)} chunks")
             chunk_texts = [chunk.content for chunk in chunks]
-            embeddings = await self.embedding_service.generate_embeddings_batch(
-                texts=chunk_texts,
-                batch_size=10
-            )
+            embeddings = await self._embed_texts(chunk_texts)
 
-            if len(embeddings) != len(chunks):
+            failed = sum(1 for embedding in embeddings if embedding is None)
+            if failed:
                 raise Exception(
-                    f"Embedding count mismatch: {len(embeddings)} != {len(chunks)}"
+                    f"Embedding generation failed for {failed} of {len(chunks)} chunks"
                 )
 
             # Step 5: Upload to vector database
-            logger.info(f"[{document_id}] Uploading to vector database")
-            chunk_ids = [f"{document_id}_chunk_{chunk.index}" for chunk in chunks]
-            vectors = [emb.embedding for emb in embeddings]
-
-            # Prepare metadata for vector DB
-            # Each chunk's metadata includes the actual text content
-            chunk_metadata = []
-            for chunk in chunks:
-                meta = chunk.metadata.copy()
-                meta['content'] = chunk.content  # Store content in metadata
-                chunk_metadata.append(meta)
-
-            chunks_uploaded = await self.vector_db.upsert_vectors(
-                ids=chunk_ids,
-                vectors=vectors,
-                metadata=chunk_metadata
-            )
+            chunks_uploaded = await self._upload_chunks(document_id, chunks, embeddings)
+            self._record_ingested(document_id, content_hash)
 
             logger.info(f"[{document_id}] Successfully ingested document")
 
@@ -220,12 +404,203 @@ class SyllabusIngestionService:
                 error=str(e)
             )
 
+    async def _parse_and_chunk(
+        self,
+        file_path: str,
+        document_id: str,
+        additional_metadata: Optional[Dict] = None
+    ) -> Tuple[Dict, List[TextChunk]]:
+        """
+        Parse a document and split it into chunks.
+
+        Args:
+            file_path: Path to the syllabus file
+            document_id: ID assigned to the document
+            additional_metadata: Additional metadata to attach
+
+        Returns:
+            Tuple of (document metadata, chunks)
+
+        Raises:
+            DocumentParseError: If the document can't be parsed
+            Exception: If no chunks are created
+        """
+        # Step 1: Parse document (in the process pool, so concurrent
+        # ingestions keep making network progress and parse in parallel)
+        logger.info(f"[{document_id}] Parsing document: {file_path}")
+        parsed_doc = await asyncio.get_running_loop().run_in_executor(
+            self._parse_pool, self.parser.parse, file_path
+        )
+
+        # Step 2: Merge metadata
+        metadata = {
+            **parsed_doc.metadata,
+            **(additional_metadata or {})
+        }
+
+        # Step 3: Chunk text
+        logger.info(f"[{document_id}] Chunking text ({len(parsed_doc.content)} chars)")
+        chunks = await asyncio.to_thread(
+            self.chunker.chunk_with_metadata_per_chunk,
+            text=parsed_doc.content,
+            base_metadata=metadata,
+            document_id=document_id
+        )
+
+        if not chunks:
+            raise Exception("No chunks created from document")
+
+        logger.info(f"[{document_id}] Created {len(chunks)} chunks")
+
+        return metadata, chunks
+
+    async def _embed_texts(self, texts: List[str]) -> List[Optional[EmbeddingResponse]]:
+        """
+        Embed texts with several batch requests in flight at once.
+
+        Texts are sorted by length before batching so each request holds
+        similarly sized texts (servers pad a batch to its longest input),
+        split into batches of the embedding service's batch size, and sent
+        with up to MAX_INFLIGHT_BATCHES requests running concurrently.
+        Identical texts are embedded once and share the result. Results are
+        returned in input order.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embeddings in input order, with None for texts whose batch failed
+        """
+        batch_size = self.embedding_service.batch_size
+        semaphore = asyncio.Semaphore(self.MAX_INFLIGHT_BATCHES)
+
+        # Repeated boilerplate (headers, footers, policy blurbs) produces
+        # identical chunks; only the first occurrence of each is sent
+        positions: Dict[str, int] = {}
+        unique_texts = []
+        for text in texts:
+            if text not in positions:
+                positions[text] = len(unique_texts)
+                unique_texts.append(text)
+
+        order = sorted(range(len(unique_texts)), key=lambda i: len(unique_texts[i]))
+        sorted_texts = [unique_texts[i] for i in order]
+
+        async def _embed_batch(batch: List[str]) -> List[EmbeddingResponse]:
+            async with semaphore:
+                # Jitter batch starts so retries after a 429 don't all
+                # hit the API at the same instant
+                await asyncio.sleep(random.uniform(0, 0.05))
+                return await self.embedding_service.generate_embeddings_batch(
+                    texts=batch,
+                    batch_size=len(batch)
+                )
+
+        results = await asyncio.gather(*[
+            _embed_batch(sorted_texts[i:i + batch_size])
+            for i in range(0, len(sorted_texts), batch_size)
+        ])
+
+        # Undo the length sort, then expand duplicates back out. Each batch is
+        # one request, so it comes back whole or empty; a failed batch leaves
+        # None for just its own texts
+        embeddings_by_unique: List[Optional[EmbeddingResponse]] = [None] * len(unique_texts)
+        for batch_start, batch_embeddings in zip(range(0, len(sorted_texts), batch_size), results):
+            batch_order = order[batch_start:batch_start + batch_size]
+            if len(batch_embeddings) != len(batch_order):
+                continue
+            for unique_idx, embedding in zip(batch_order, batch_embeddings):
+                embeddings_by_unique[unique_idx] = embedding
+
+        return [embeddings_by_unique[positions[text]] for text in texts]
+
+    async def _upload_chunks(
+        self,
+        document_id: str,
+        chunks: List[TextChunk],
+        embeddings: List[EmbeddingResponse]
+    ) -> int:
+        """
+        Upload a document's chunks and their embeddings to the vector database.
+
+        Args:
+            document_id: ID of the document the chunks belong to
+            chunks: Document chunks
+            embeddings: Embeddings in the same order as chunks
+
+        Returns:
+            Number of chunks uploaded
+        """
+        logger.info(f"[{document_id}] Uploading to vector database")
+        chunk_ids = [f"{document_id}_chunk_{chunk.index}" for chunk in chunks]
+        # One contiguous float32 array instead of a list of Python float lists
+        vectors = np.asarray([emb.embedding for emb in embeddings], dtype=np.float32)
+        if self._expected_dim is not None and vectors.shape[-1] != self._expected_dim:
+            # Rejected locally rather than after an upsert round-trip
+            raise ValueError(
+                f"Embedding dimension {vectors.shape[-1]} does not match "
+                f"expected dimension {self._expected_dim}"
+            )
+        scales = None
+        if self.embedding_dtype == 'int8':
+            vectors, scales = self._quantize_int8(vectors)
+
+        # Prepare metadata for vector DB
+        # Each chunk's metadata includes the actual text content. Every chunk
+        # owns its metadata dict, so content is added in place without a copy
+        chunk_metadata = []
+        for i, chunk in enumerate(chunks):
+            chunk.metadata['content'] = chunk.content  # Store content in metadata
+            if scales is not None:
+                # Lets the float vector be rebuilt as int8 values * scale
+                chunk.metadata['embedding_scale'] = float(scales[i])
+            chunk_metadata.append(chunk.metadata)
+
+        # Upsert in sub-batches, a few at a time, so request bodies stay
+        # small and the database can start indexing before the last batch
+        batch_size = self.upsert_batch_size
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_UPSERTS)
+
+        async def _upsert(start: int) -> int:
+            end = start + batch_size
+            async with semaphore:
+                return await self.vector_db.upsert_vectors(
+                    ids=chunk_ids[start:end],
+                    vectors=vectors[start:end],
+                    metadata=chunk_metadata[start:end]
+                )
+
+        counts = await asyncio.gather(*[
+            _upsert(start) for start in range(0, len(chunk_ids), batch_size)
+        ])
+
+        return sum(counts)
+
+    @staticmethod
+    def _quantize_int8(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Symmetrically quantize each vector to int8.
+
+        Args:
+            vectors: (n, dim) float32 array
+
+        Returns:
+            Tuple of the (n, dim) int8 array and the (n,) per-vector scales
+        """
+        scales = np.abs(vectors).max(axis=1) / 127
+        # All-zero vectors would divide by zero; any scale maps them to zero
+        scales[scales == 0] = 1.0
+        quantized = np.round(vectors / scales[:, None]).astype(np.int8)
+        return quantized, scales
+
     async def ingest_directory(
         self,
         directory_path: str,
         file_extensions: Optional[List[str]] = None,
         recursive: bool = False,
-        show_progress: bool = True
+        show_progress: bool = True,
+        max_concurrent_files: int = 8,
+        force: bool = False
     ) -> BatchIngestionResult:
         """
         Ingest all syllabus files in a directory.
@@ -235,6 +610,8 @@ class SyllabusIngestionService:
             file_extensions: List of extensions to process (default: ['.pdf', '.docx', '.txt'])
             recursive: Whether to search subdirectories
             show_progress: Whether to show progress bar
+            max_concurrent_files: Maximum files ingested at the same time
+            force: Re-ingest files even if they are unchanged
 
         Returns:
             BatchIngestionResult with summary
@@ -247,68 +624,199 @@ class SyllabusIngestionService:
             )
             print(f"Processed {result.successful}/{result.total_files} files")
         """
-        # Default file extensions
-        if file_extensions is None:
-            file_extensions = ['.pdf', '.docx', '.txt', '.md']
+        files = self._find_files(directory_path, file_extensions, recursive)
 
-        # Find all files
-        directory = Path(directory_path).expanduser()
-        if not directory.exists():
-            raise ValueError(f"Directory does not exist: {directory_path}")
+        if not files:
+            return self._summarize([])
 
-        files = []
-        if recursive:
-            for ext in file_extensions:
-                files.extend(directory.rglob(f"*{ext}"))
-        else:
-            for ext in file_extensions:
-                files.extend(directory.glob(f"*{ext}"))
+        # Process files concurrently, bounded so embedding requests and
+        # parser threads don't grow with the directory size
+        semaphore = asyncio.Semaphore(max_concurrent_files)
+        progress = tqdm(total=len(files), desc="Ingesting syllabi") if show_progress else None
 
-        files = [str(f) for f in files]
+        async def _run(file_path: str) -> IngestionResult:
+            async with semaphore:
+                result = await self.ingest_file(file_path, force=force)
+            if progress:
+                progress.update(1)
+            return result
 
-        logger.info(f"Found {len(files)} files to process in {directory_path}")
+        try:
+            results = await asyncio.gather(*[_run(f) for f in files])
+        finally:
+            if progress:
+                progress.close()
+            self._save_content_cache()
+
+        return self._summarize(results)
+
+    async def ingest_directory_batched(
+        self,
+        directory_path: str,
+        file_extensions: Optional[List[str]] = None,
+        recursive: bool = False,
+        max_concurrent_files: int = 8,
+        force: bool = False
+    ) -> BatchIngestionResult:
+        """
+        Ingest a directory, embedding chunks from all files together.
+
+        Unlike ingest_directory, which embeds each file separately, this
+        parses and chunks every file first and then embeds the pooled chunks
+        in full-size batches, so small files don't each cost a request.
+
+        Args:
+            directory_path: Path to directory containing syllabi
+            file_extensions: List of extensions to process
+            recursive: Whether to search subdirectories
+            max_concurrent_files: Maximum files parsed at the same time
+            force: Re-ingest files even if they are unchanged
+
+        Returns:
+            BatchIngestionResult with summary
+        """
+        files = self._find_files(directory_path, file_extensions, recursive)
 
         if not files:
-            return BatchIngestionResult(
-                total_files=0,
-                successful=0,
-                failed=0,
-                total_chunks=0,
-                results=[]
-            )
+            return self._summarize([])
+
+        # Steps 1-3: Parse and chunk every file
+        semaphore = asyncio.Semaphore(max_concurrent_files)
+
+        async def _prepare(file_path: str):
+            document_id = self._generate_document_id(file_path)
+            try:
+                async with semaphore:
+                    content_hash, skipped = await self._unchanged_result(document_id, file_path)
+                    if skipped and not force:
+                        return skipped
+                    metadata, chunks = await self._parse_and_chunk(file_path, document_id)
+                return document_id, metadata, chunks, content_hash
+            except Exception as e:
+                logger.error(f"[{document_id}] Ingestion failed: {e}")
+                return IngestionResult(
+                    success=False,
+                    document_id=document_id,
+                    file_path=file_path,
+                    error=str(e)
+                )
+
+        prepared = await asyncio.gather(*[_prepare(f) for f in files])
 
-        # Process files with progress bar
+        # Step 4: Embed all chunks together, then scatter results back to files
+        all_chunks = [
+            (file_idx, chunk)
+            for file_idx, item in enumerate(prepared)
+            if not isinstance(item, IngestionResult)
+            for chunk in item[2]
+        ]
+
+        logger.info(f"Generating embeddings for {len(all_chunks)} chunks from {len(files)} files")
+        embeddings = await self._embed_texts(
+            [chunk.content for _, chunk in all_chunks]
+        )
+
+        # Chunks from a failed embedding batch have no entry, so only the
+        # files that owned them fail below
+        per_file: Dict[int, Dict[int, EmbeddingResponse]] = defaultdict(dict)
+        for (file_idx, chunk), embedding in zip(all_chunks, embeddings):
+            if embedding is not None:
+                per_file[file_idx][chunk.index] = embedding
+
+        # Step 5: Upload each file's chunks
         results = []
-        total_chunks = 0
+        for file_idx, (file_path, item) in enumerate(zip(files, prepared)):
+            if isinstance(item, IngestionResult):
+                results.append(item)
+                continue
+
+            document_id, metadata, chunks, content_hash = item
+            file_embeddings = per_file.get(file_idx, {})
+
+            try:
+                if len(file_embeddings) != len(chunks):
+                    raise Exception("Embedding generation failed")
+
+                chunks_uploaded = await self._upload_chunks(
+                    document_id,
+                    chunks,
+                    [file_embeddings[chunk.index] for chunk in chunks]
+                )
+                self._record_ingested(document_id, content_hash)
+                results.append(IngestionResult(
+                    success=True,
+                    document_id=document_id,
+                    file_path=file_path,
+                    chunks_created=len(chunks),
+                    chunks_uploaded=chunks_uploaded,
+                    metadata=metadata
+                ))
+
+            except Exception as e:
+                logger.error(f"[{document_id}] Ingestion failed: {e}")
+                results.append(IngestionResult(
+                    success=False,
+                    document_id=document_id,
+                    file_path=file_path,
+                    error=str(e)
+                ))
+
+        self._save_content_cache()
+        return self._summarize(results)
+
+    def _find_files(
+        self,
+        directory_path: str,
+        file_extensions: Optional[List[str]],
+        recursive: bool
+    ) -> List[str]:
+        """
+        Find syllabus files in a directory.
 
-        iterator = tqdm(files, desc="Ingesting syllabi") if show_progress else files
+        Raises:
+            ValueError: If the directory doesn't exist
+        """
+        # Default file extensions
+        if file_extensions is None:
+            file_extensions = ['.pdf', '.docx', '.txt', '.md']
 
-        for file_path in iterator:
-            result = await self.ingest_file(file_path)
-            results.append(result)
+        directory = Path(directory_path).expanduser()
+        if not directory.exists():
+            raise ValueError(f"Directory does not exist: {directory_path}")
 
-            if result.success:
-                total_chunks += result.chunks_created
+        # Walk the tree once and filter by extension, rather than one glob
+        # per extension each re-walking the whole directory
+        extensions = {ext.lower() for ext in file_extensions}
+        entries = directory.rglob('*') if recursive else directory.iterdir()
+        files = [
+            str(entry) for entry in entries
+            if entry.suffix.lower() in extensions and entry.is_file()
+        ]
 
-        # Calculate summary
-        successful = sum(1 for r in results if r.success)
-        failed = len(results) - successful
+        logger.info(f"Found {len(files)} files to process in {directory_path}")
+        return files
+
+    def _summarize(self, results: List[IngestionResult]) -> BatchIngestionResult:
+        """Build a BatchIngestionResult from per-file results."""
+        skipped = sum(1 for r in results if r.skipped)
+        successful = sum(1 for r in results if r.success and not r.skipped)
+        total_chunks = sum(r.chunks_created for r in results if r.success)
+
+        if results:
+            logger.info(
+                f"Batch ingestion complete: {successful}/{len(results)} succeeded, "
+                f"{skipped} unchanged, {total_chunks} total chunks"
+            )
 
-        batch_result = BatchIngestionResult(
-            total_files=len(files),
+        return BatchIngestionResult(
+            total_files=len(results),
             successful=successful,
-            failed=failed,
+            failed=len(results) - successful - skipped,
             total_chunks=total_chunks,
+            skipped=skipped,
             results=results
         )
 
-        logger.info(
-            f"Batch ingestion complete: {successful}/{len(files)} succeeded, "
-            f"{total_chunks} total chunks"
-        )
-
-        return batch_result
-
     async def delete_document(
         self,
         document_id: str
@@ -327,6 +835,11 @@ class SyllabusIngestionService:
             await self.vector_db.delete_by_filter({
                 'document_id': document_id
             })
+            # A deleted document must be re-ingested even if unchanged
+            key = self._cache_key(document_id)
+            if self._content_cache.pop(key, None) is not None:
+                self._cache_updates[key] = None
+                self._save_content_cache()
 
             logger.info(f"Deleted document: {document_id}")
             return True
@@ -335,17 +848,16 @@ class SyllabusIngestionService:
             logger.error(f"Failed to delete document {document_id}: {e}")
             return False
 
+    def close(self) -> None:
+        """Persist the content hash cache and shut down the parsing process pool."""
+        self._save_content_cache()
+        self._parse_pool.shutdown(wait=False, cancel_futures=True)
+
     def _generate_document_id(self, file_path: str) -> str:
         """
         Generate a unique document ID from file path.
 
         Uses filename without extension as base ID.
         """
-        path = Path(file_path)
-        # Use filename without extension
-        doc_id = path.stem
-
-        # Clean ID (remove special characters)
-        doc_id = doc_id.replace(' ', '_').replace('-', '_')
-
-        return doc_id
+        # Use filename without extension, cleaned in a single pass
+        return Path(file_path).stem.translate(_DOC_ID_TRANS)
@@ -3,13 +3,31 @@ Text chunking service for splitting documents into semantically meaningful chunk
 Implements multiple chunking strategies for optimal retrieval.
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List, Tuple
 from dataclasses import dataclass
 import logging
 import re
 
 logger = logging.getLogger(__name__)
 
+# One sentence: from a non-space character up to a terminator (.!?) that is
+# followed by whitespace, or to the last non-space character of the text
+_SENTENCE_RE = re.compile(r'\S(?:.*?(?<=[.!?])(?=\s)|.*\S)?', re.DOTALL)
+
+# Common syllabus section headers
+_SECTION_PATTERNS = [
+    r'^[A-Z][A-Z\s]{3,}$',  # ALL CAPS HEADINGS
+    r'^\d+\.\s+[A-Z]',  # 1. Introduction
+    r'^[IVX]+\.\s+[A-Z]',  # I. Introduction (Roman numerals)
+    r'^(?:Course|Grading|Schedule|Prerequisites|Textbook|Office Hours)',  # Common headers
+]
+
+# Combined without capture groups, since only whether a line matches is used
+_SECTION_RE = re.compile(
+    '|'.join(f'(?:{p})' for p in _SECTION_PATTERNS),
+    re.MULTILINE
+)
+
 
 @dataclass
 class TextChunk:
@@ -23,6 +41,10 @@ class TextChunk:
         end_char: Ending character position in original document
         metadata: Additional metadata (document_id, etc.)
     """
+    # Created once per chunk, so instances skip the per-object __dict__.
+    # Declared by hand since dataclass(slots=True) needs Python 3.10
+    __slots__ = ('content', 'index', 'start_char', 'end_char', 'metadata')
+
     content: str
     index: int
     start_char: int
@@ -72,6 +94,9 @@ class FixedSizeChunkingStrategy(ChunkingStrategy):
         if overlap >= chunk_size:
             raise ValueError("Overlap must be smaller than chunk_size")
 
+        # Distance between consecutive chunk starts
+        self.step_size = chunk_size - overlap
+
     def chunk(self, text: str, **kwargs) -> List[TextChunk]:
         """
         Chunk text into fixed-size pieces with overlap.
@@ -83,26 +108,113 @@ class FixedSizeChunkingStrategy(ChunkingStrategy):
         Returns:
             List of TextChunk objects
         """
-        chunks = []
-        step_size = self.chunk_size - self.overlap
+        chunks = list(self.iter_chunks(text, kwargs.get('metadata', {})))
+
+        logger.debug(f"Created {len(chunks)} fixed-size chunks")
+        return chunks
 
-        for i in range(0, len(text), step_size):
-            chunk_text = text[i:i + self.chunk_size]
+    def iter_chunks(self, text: str, metadata: dict = None) -> Iterator[TextChunk]:
+        """
+        Lazily yield fixed-size chunks with overlap.
 
-            # Skip very small chunks at the end
-            if len(chunk_text) < 50:
-                continue
+        Window boundaries are computed from offsets alone, and each chunk's
+        text is sliced only when it is yielded, so consumers that stream
+        chunks never hold every overlapping substring at once.
 
-            chunk = TextChunk(
-                content=chunk_text.strip(),
-                index=len(chunks),
+        Args:
+            text: Text to chunk
+            metadata: Metadata to attach to chunks
+
+        Yields:
+            TextChunk objects in document order
+        """
+        text_length = len(text)
+        chunk_size = self.chunk_size
+        step_size = self.step_size
+        metadata = metadata if metadata is not None else {}
+
+        # Very small chunks (< 50 chars) are skipped. Only trailing windows
+        # can be that short, so the last usable start offset is computed up
+        # front instead of testing every slice
+        last_start = text_length - 50 if chunk_size >= 50 else -1
+
+        for index, i in enumerate(range(0, last_start + 1, step_size)):
+            yield TextChunk(
+                content=text[i:i + chunk_size].strip(),
+                index=index,
                 start_char=i,
-                end_char=min(i + self.chunk_size, len(text)),
-                metadata=kwargs.get('metadata', {})
+                end_char=min(i + chunk_size, text_length),
+                metadata=metadata
             )
-            chunks.append(chunk)
 
-        logger.debug(f"Created {len(chunks)} fixed-size chunks")
+
+class StrideChunkingStrategy(ChunkingStrategy):
+    """
+    Sliding-window chunking with an explicit stride.
+
+    Windows of `window` characters start every `stride` characters, so
+    consecutive chunks overlap by window - stride:
+    - Overlap is set by the stride instead of a fixed character count
+    - A smaller stride improves recall at the cost of a larger index
+    - The last window is aligned to the end of the text so no tail is lost
+
+    Parameters:
+        window: Number of characters per chunk (default: 500)
+        stride: Distance between chunk starts (default: 75% of window)
+    """
+
+    def __init__(self, window: int = 500, stride: int = None):
+        """
+        Initialize sliding-window chunking strategy.
+
+        Args:
+            window: Chunk size in characters
+            stride: Characters between consecutive chunk starts
+
+        Raises:
+            ValueError: If window or stride is not positive, or stride > window
+        """
+        self.window = window
+        self.stride = stride if stride is not None else max(1, int(0.75 * window))
+
+        if window <= 0 or self.stride <= 0:
+            raise ValueError("window and stride must be positive")
+        if self.stride > window:
+            raise ValueError("stride must not exceed window, or text would be skipped")
+
+    def chunk(self, text: str, **kwargs) -> List[TextChunk]:
+        """
+        Chunk text into overlapping windows.
+
+        Args:
+            text: Text to chunk
+            **kwargs: Additional metadata to attach to chunks
+
+        Returns:
+            List of TextChunk objects
+        """
+        metadata = kwargs.get('metadata', {})
+        text_length = len(text)
+        window = self.window
+
+        # (n - window) // stride + 1 windows fit entirely inside the text;
+        # a final window ending at the text's end covers any remainder
+        starts = list(range(0, max(text_length - window, 0) + 1, self.stride))
+        if starts[-1] + window < text_length:
+            starts.append(text_length - window)
+
+        chunks = [
+            TextChunk(
+                content=text[start:start + window].strip(),
+                index=index,
+                start_char=start,
+                end_char=min(start + window, text_length),
+                metadata=metadata
+            )
+            for index, start in enumerate(starts)
+        ]
+
+        logger.debug(f"Created {len(chunks)} sliding-window chunks")
         return chunks
 
 
@@ -144,64 +256,61 @@ class SentenceChunkingStrategy(ChunkingStrategy):
         Returns:
             List of TextChunk objects
         """
-        # Split text into sentences
+        # Split text into sentence spans
         sentences = self._split_into_sentences(text)
+        metadata = kwargs.get('metadata', {})
 
         chunks = []
-        current_chunk = []
+
+        def _emit(start: int, end: int) -> None:
+            # Slice the source once per chunk, so offsets are exact
+            chunks.append(TextChunk(
+                content=text[start:end],
+                index=len(chunks),
+                start_char=start,
+                end_char=end,
+                metadata=metadata
+            ))
+
+        chunk_start = None
+        chunk_end = 0
         current_length = 0
-        start_char = 0
 
-        for sentence in sentences:
-            sentence_length = len(sentence)
+        for start, end in sentences:
+            sentence_length = end - start
 
             # If adding this sentence would exceed max size, create a chunk
-            if current_length + sentence_length > self.max_size and current_chunk:
-                chunk_text = " ".join(current_chunk)
-                chunks.append(TextChunk(
-                    content=chunk_text,
-                    index=len(chunks),
-                    start_char=start_char,
-                    end_char=start_char + len(chunk_text),
-                    metadata=kwargs.get('metadata', {})
-                ))
+            if current_length + sentence_length > self.max_size and chunk_start is not None:
+                _emit(chunk_start, chunk_end)
 
                 # Start new chunk
-                current_chunk = [sentence]
+                chunk_start = start
                 current_length = sentence_length
-                start_char += len(chunk_text) + 1
             else:
-                current_chunk.append(sentence)
+                if chunk_start is None:
+                    chunk_start = start
                 current_length += sentence_length
+            chunk_end = end
 
         # Add final chunk
-        if current_chunk:
-            chunk_text = " ".join(current_chunk)
-            chunks.append(TextChunk(
-                content=chunk_text,
-                index=len(chunks),
-                start_char=start_char,
-                end_char=start_char + len(chunk_text),
-                metadata=kwargs.get('metadata', {})
-            ))
+        if chunk_start is not None:
+            _emit(chunk_start, chunk_end)
 
         logger.debug(f"Created {len(chunks)} sentence-based chunks")
         return chunks
 
-    def _split_into_sentences(self, text: str) -> List[str]:
+    def _split_into_sentences(self, text: str) -> List[Tuple[int, int]]:
         """
         Split text into sentences.
 
         Uses simple heuristics for sentence boundaries.
+
+        Returns:
+            (start, end) character offsets of each sentence in text
         """
         # Simple sentence splitting (can be improved with nltk or spacy)
-        # Split on periods, exclamation marks, question marks
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-
-        # Filter out empty sentences
-        sentences = [s.strip() for s in sentences if s.strip()]
-
-        return sentences
+        # Matches never start or end with whitespace, so no strip/filter pass
+        return [match.span() for match in _SENTENCE_RE.finditer(text)]
 
 
 class SectionChunkingStrategy(ChunkingStrategy):
@@ -259,25 +368,15 @@ class SectionChunkingStrategy(ChunkingStrategy):
         - Numbered sections (1., 2., etc.)
         - Common syllabus headers
         """
-        # Common syllabus section headers
-        section_patterns = [
-            r'^[A-Z][A-Z\s]{3,}$',  # ALL CAPS HEADINGS
-            r'^\d+\.\s+[A-Z]',  # 1. Introduction
-            r'^[IVX]+\.\s+[A-Z]',  # I. Introduction (Roman numerals)
-            r'^(?:Course|Grading|Schedule|Prerequisites|Textbook|Office Hours)',  # Common headers
-        ]
-
-        # Combine patterns
-        combined_pattern = '|'.join(f'({p})' for p in section_patterns)
-
         # Split by section headers
         lines = text.split('\n')
         sections = []
         current_section = []
+        is_header = _SECTION_RE.match
 
         for line in lines:
             # Check if line is a section header
-            if re.match(combined_pattern, line.strip(), re.MULTILINE):
+            if is_header(line.strip()):
                 # Save previous section
                 if current_section:
                     sections.append('\n'.join(current_section))
@@ -314,6 +413,7 @@ class TextChunker:
 
     STRATEGIES = {
         'fixed_size': FixedSizeChunkingStrategy,
+        'sliding_window': StrideChunkingStrategy,
         'sentence': SentenceChunkingStrategy,
         'section': SectionChunkingStrategy,
     }
@@ -323,7 +423,8 @@ class TextChunker:
         Initialize text chunker with a strategy.
 
         Args:
-            strategy: Name of chunking strategy ('fixed_size', 'sentence', 'section')
+            strategy: Name of chunking strategy ('fixed_size', 'sliding_window',
+                      'sentence', 'section')
             **strategy_params: Parameters to pass to the strategy
 
         Raises:
@@ -377,13 +478,17 @@ class TextChunker:
         """
         chunks = self.chunk(text, metadata=base_metadata)
 
-        # Enrich each chunk's metadata
+        # Enrich each chunk's metadata. Strategies share one metadata dict
+        # across chunks, so each chunk gets its own dict here; updating the
+        # shared one would give every chunk the last chunk's index
+        total_chunks = len(chunks)
         for chunk in chunks:
-            chunk.metadata.update({
+            chunk.metadata = {
+                **chunk.metadata,
                 'document_id': document_id,
                 'chunk_index': chunk.index,
-                'total_chunks': len(chunks),
+                'total_chunks': total_chunks,
                 'chunking_strategy': self.strategy_name
-            })
+            }
 
         return chunks
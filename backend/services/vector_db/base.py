@@ -3,10 +3,12 @@ Abstract base class for vector database operations.
 Defines the contract that all vector database adapters must implement.
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 from dataclasses import dataclass
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +23,9 @@ class VectorSearchResult:
         metadata: Additional information (course_code, instructor, etc.)
         similarity_score: Relevance score (0-1, higher is better)
     """
+    # Created once per search match, so instances skip the per-object __dict__
+    __slots__ = ('id', 'content', 'metadata', 'similarity_score')
+
     id: str
     content: str
     metadata: Dict
@@ -45,15 +50,27 @@ class VectorDatabaseInterface(ABC):
 
     Design Pattern: Strategy Pattern
     SOLID Principle: Dependency Inversion (depend on abstraction, not concrete)
+
+    Attributes:
+        write_version: Incremented by adapters after every upsert or delete
+                       that may have changed stored vectors, so callers can
+                       tell when results cached from earlier reads are stale
     """
 
+    write_version: int = 0
+
     @abstractmethod
-    async def initialize(self) -> None:
+    async def initialize(self, expected_dim: Optional[int] = None) -> None:
         """
         Initialize the vector database connection and create index/collection.
 
+        Args:
+            expected_dim: Dimension of the embeddings that will be stored. When
+                          given, a mismatched index fails here instead of on
+                          the first upsert, after a document has been embedded
+
         Raises:
-            VectorDatabaseError: If initialization fails
+            VectorDatabaseError: If initialization fails or dimensions differ
         """
         pass
 
@@ -61,7 +78,7 @@ class VectorDatabaseInterface(ABC):
     async def upsert_vectors(
         self,
         ids: List[str],
-        vectors: List[List[float]],
+        vectors: Union[List[List[float]], np.ndarray],
         metadata: List[Dict]
     ) -> int:
         """
@@ -69,7 +86,9 @@ class VectorDatabaseInterface(ABC):
 
         Args:
             ids: List of unique identifiers
-            vectors: List of embedding vectors
+            vectors: Embedding vectors, as a list of lists or an (n, dim)
+                     float32 array (4 bytes per value instead of a Python float),
+                     or an int8 array of quantized vectors
             metadata: List of metadata dicts (must include 'content' field)
 
         Returns:
@@ -86,17 +105,22 @@ class VectorDatabaseInterface(ABC):
     @abstractmethod
     async def search(
         self,
-        query_vector: List[float],
+        query_vector: Union[List[float], np.ndarray],
         top_k: int = 5,
-        filter: Optional[Dict] = None
+        filter: Optional[Dict] = None,
+        score_threshold: Optional[float] = None
     ) -> List[VectorSearchResult]:
         """
         Search for similar vectors.
 
         Args:
-            query_vector: The query embedding vector
+            query_vector: The query embedding vector (list or float32 array).
+                          RAGService passes unit-length vectors, so
+                          inner-product indexes score them as cosine
             top_k: Number of results to return
             filter: Optional metadata filter (e.g., {"course_code": "CS101"})
+            score_threshold: Minimum similarity score; lower-scoring matches
+                             are dropped by the adapter
 
         Returns:
             List of search results ordered by similarity (highest first)
@@ -2,14 +2,47 @@
 Factory for creating vector database instances.
 Implements Factory Pattern for dependency injection and easy swapping.
 """
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+import asyncio
+import functools
 import logging
+import os
+import threading
 from .base import VectorDatabaseInterface
 from .pinecone_adapter import PineconeAdapter
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _read_env_config(provider: str) -> Tuple[Tuple[str, object], ...]:
+    """
+    Read a provider's configuration from environment variables.
+
+    Cached per provider, so the environment is parsed once per process.
+    Returned as a tuple of items so the cached value can't be mutated.
+
+    Raises:
+        ValueError: If required environment variables are missing
+    """
+    if provider == "pinecone":
+        api_key = os.getenv("PINECONE_API_KEY")
+        if not api_key:
+            raise ValueError("PINECONE_API_KEY environment variable is required")
+
+        return (
+            ("api_key", api_key),
+            ("index_name", os.getenv("PINECONE_INDEX_NAME", "syllabi")),
+            ("dimension", int(os.getenv("PINECONE_DIMENSION", "1024"))),
+            ("metric", os.getenv("PINECONE_METRIC", "cosine")),
+            ("cloud", os.getenv("PINECONE_CLOUD", "aws")),
+            ("region", os.getenv("PINECONE_REGION", "us-east-1")),
+        )
+
+    # Add more providers as needed
+    raise ValueError(f"Environment-based config not implemented for: {provider}")
+
+
 class VectorDatabaseFactory:
     """
     Factory for creating vector database instances.
@@ -25,6 +58,9 @@ class VectorDatabaseFactory:
         }
         db = VectorDatabaseFactory.create("pinecone", config)
         await db.initialize()
+
+    Instances are cached per (provider, config), so every caller with the
+    same configuration shares one adapter and its client connections.
     """
 
     _supported_providers = {
@@ -35,6 +71,13 @@ class VectorDatabaseFactory:
         # "weaviate": WeaviateAdapter,
     }
 
+    # Shared adapters keyed by (provider, config). Creation is guarded by a
+    # threading lock; initialization by one asyncio lock per key
+    _instances: Dict[Tuple, VectorDatabaseInterface] = {}
+    _initialized: set = set()
+    _init_locks: Dict[Tuple, asyncio.Lock] = {}
+    _lock = threading.Lock()
+
     @classmethod
     def create(
         cls,
@@ -50,7 +93,8 @@ class VectorDatabaseFactory:
             config: Provider-specific configuration dict
 
         Returns:
-            VectorDatabaseInterface instance
+            VectorDatabaseInterface instance, shared with every other caller
+            that passed the same provider and config
 
         Raises:
             ValueError: If provider is not supported
@@ -77,11 +121,71 @@ class VectorDatabaseFactory:
                 f"Supported providers: {supported}"
             )
 
-        adapter_class = cls._supported_providers[provider_lower]
+        key = cls._cache_key(provider_lower, config)
+        with cls._lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                adapter_class = cls._supported_providers[provider_lower]
+
+                logger.info(f"Creating {provider} vector database adapter")
 
-        logger.info(f"Creating {provider} vector database adapter")
+                instance = adapter_class(**config)
+                cls._instances[key] = instance
 
-        return adapter_class(**config)
+        return instance
+
+    @classmethod
+    async def get_or_create(
+        cls,
+        provider: str,
+        config: Dict,
+        expected_dim: Optional[int] = None
+    ) -> VectorDatabaseInterface:
+        """
+        Get a shared vector database instance, initializing it exactly once.
+
+        Concurrent callers for the same configuration wait on one
+        initialize() call instead of each connecting separately.
+
+        Args:
+            provider: Name of the vector database provider
+            config: Provider-specific configuration dict
+            expected_dim: Embedding dimension passed to initialize()
+
+        Returns:
+            Initialized VectorDatabaseInterface instance
+
+        Raises:
+            ValueError: If provider is not supported
+            VectorDatabaseError: If initialization fails
+        """
+        instance = cls.create(provider, config)
+        key = cls._cache_key(provider.lower(), config)
+
+        if key in cls._initialized:
+            return instance
+
+        lock = cls._init_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if key not in cls._initialized:
+                await instance.initialize(expected_dim=expected_dim)
+                cls._initialized.add(key)
+
+        return instance
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all shared instances and cached env config, e.g. between tests."""
+        _read_env_config.cache_clear()
+        with cls._lock:
+            cls._instances.clear()
+            cls._initialized.clear()
+            cls._init_locks.clear()
+
+    @staticmethod
+    def _cache_key(provider: str, config: Dict) -> Tuple:
+        """Build the instance cache key for a provider and config."""
+        return (provider, frozenset(config.items()))
 
     @classmethod
     def create_from_env(cls, provider: str) -> VectorDatabaseInterface:
@@ -99,28 +203,12 @@ class VectorDatabaseFactory:
 
         Note:
             This method is useful for production deployment where
-            configuration is stored in environment variables.
+            configuration is stored in environment variables. The
+            environment is read once per process, and the adapter is shared
+            through the instance cache.
         """
-        import os
-
-        if provider.lower() == "pinecone":
-            api_key = os.getenv("PINECONE_API_KEY")
-            if not api_key:
-                raise ValueError("PINECONE_API_KEY environment variable is required")
-
-            config = {
-                "api_key": api_key,
-                "index_name": os.getenv("PINECONE_INDEX_NAME", "syllabi"),
-                "dimension": int(os.getenv("PINECONE_DIMENSION", "1024")),
-                "metric": os.getenv("PINECONE_METRIC", "cosine"),
-                "cloud": os.getenv("PINECONE_CLOUD", "aws"),
-                "region": os.getenv("PINECONE_REGION", "us-east-1")
-            }
-
-            return cls.create("pinecone", config)
-
-        # Add more providers as needed
-        raise ValueError(f"Environment-based config not implemented for: {provider}")
+        provider_lower = provider.lower()
+        return cls.create(provider_lower, dict(_read_env_config(provider_lower)))
 
     @classmethod
     def list_supported_providers(cls) -> list:
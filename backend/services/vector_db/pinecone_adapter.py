@@ -2,19 +2,104 @@
 Pinecone vector database adapter.
 Implements VectorDatabaseInterface for Pinecone cloud vector database.
 """
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
+import asyncio
 import logging
+import time
+
+import numpy as np
 from pinecone import Pinecone, ServerlessSpec
+from pinecone.core.openapi.shared.configuration import Configuration as OpenApiConfiguration
+from pinecone.data import Index
+from pinecone.exceptions import NotFoundException
 from .base import (
     VectorDatabaseInterface,
     VectorSearchResult,
-    VectorDatabaseError,
     VectorDatabaseConnectionError,
     VectorDatabaseOperationError
 )
 
 logger = logging.getLogger(__name__)
 
+# Pinecone rejects metadata string values over 40KB
+_MAX_METADATA_STR_LEN = 40000
+
+# Exact types accepted as-is in metadata values and lists
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool))
+
+
+def _sanitize_str(value: str) -> str:
+    # Truncate long strings to avoid Pinecone limits
+    return value[:_MAX_METADATA_STR_LEN] if len(value) > _MAX_METADATA_STR_LEN else value
+
+
+def _passthrough(value):
+    return value
+
+
+def _sanitize_list(value: list):
+    # Only keep lists of primitives (no None values in list)
+    if all(type(v) in _PRIMITIVE_TYPES for v in value):
+        return value
+    if all(isinstance(v, (str, int, float, bool)) for v in value):
+        return value
+    return str(value)
+
+
+def _sanitize_other(value):
+    # Convert datetime to ISO string
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    # Subclasses of the primitive types (e.g. numpy floats)
+    if isinstance(value, str):
+        return _sanitize_str(value)
+    if isinstance(value, (int, float, bool)):
+        return value
+    if isinstance(value, list):
+        return _sanitize_list(value)
+    # Convert complex objects to strings
+    return str(value)
+
+
+# Sanitizers for the value types metadata almost always holds, looked up by
+# exact type so the common case skips the isinstance/hasattr chain
+_SANITIZERS = {
+    str: _sanitize_str,
+    int: _passthrough,
+    float: _passthrough,
+    bool: _passthrough,
+    list: _sanitize_list,
+}
+
+
+def _sanitize_metadata(metadata: Dict) -> Dict:
+    """
+    Sanitize metadata for Pinecone compatibility.
+
+    Pinecone requirements:
+    - All values must be JSON-serializable (str, int, float, bool, list of primitives)
+    - No nested dicts
+    - No datetime objects
+    - No null/None values
+    - String values must be <40KB
+
+    Args:
+        metadata: Raw metadata dict
+
+    Returns:
+        Sanitized metadata dict
+    """
+    sanitized = {}
+    get_sanitizer = _SANITIZERS.get
+    for key, value in metadata.items():
+        # Skip None values - Pinecone doesn't accept null
+        if value is None:
+            continue
+        sanitize = get_sanitizer(type(value), _sanitize_other)
+        sanitized[key] = sanitize(value)
+
+    return sanitized
+
 
 class PineconeAdapter(VectorDatabaseInterface):
     """
@@ -31,6 +116,9 @@ class PineconeAdapter(VectorDatabaseInterface):
         - metric: Similarity metric ('cosine' recommended)
     """
 
+    # Seconds a successful call keeps health_check from probing again
+    HEALTH_CHECK_TTL = 5.0
+
     def __init__(
         self,
         api_key: str,
@@ -38,7 +126,9 @@ class PineconeAdapter(VectorDatabaseInterface):
         dimension: int = 1024,
         metric: str = "cosine",
         cloud: str = "aws",
-        region: str = "us-east-1"
+        region: str = "us-east-1",
+        upsert_batch_size: int = 100,
+        upsert_concurrency: int = 8
     ):
         """
         Initialize Pinecone adapter.
@@ -50,6 +140,11 @@ class PineconeAdapter(VectorDatabaseInterface):
             metric: Distance metric ('cosine', 'euclidean', 'dotproduct')
             cloud: Cloud provider ('aws', 'gcp', 'azure')
             region: Cloud region
+            upsert_batch_size: Vectors per upsert request. Pinecone caps requests
+                               at 2MB, which 1024-dim vectors plus chunk text
+                               approach at a few hundred per request
+            upsert_concurrency: Upsert requests in flight at once; also sizes
+                                the index's HTTP connection pool
         """
         self.api_key = api_key
         self.index_name = index_name
@@ -57,13 +152,22 @@ class PineconeAdapter(VectorDatabaseInterface):
         self.metric = metric
         self.cloud = cloud
         self.region = region
+        self.upsert_batch_size = upsert_batch_size
+        self.upsert_concurrency = upsert_concurrency
 
         self.pc = None
         self.index = None
 
+        # Monotonic time of the last successful Pinecone call
+        self._last_ok = 0.0
+
+        # Created on first use so it binds to the running event loop
+        self._init_lock: Optional[asyncio.Lock] = None
+        self._expected_dim: Optional[int] = None
+
         logger.info(f"Initialized PineconeAdapter for index: {index_name}")
 
-    async def initialize(self) -> None:
+    async def initialize(self, expected_dim: Optional[int] = None) -> None:
         """
         Initialize Pinecone connection and create index if it doesn't exist.
 
@@ -71,94 +175,122 @@ class PineconeAdapter(VectorDatabaseInterface):
         1. Connects to Pinecone
         2. Creates index if it doesn't exist (serverless, free tier)
         3. Connects to the index
+        4. Checks the index dimension against expected_dim
+
+        Args:
+            expected_dim: Dimension of the embeddings that will be stored
 
         Raises:
-            VectorDatabaseConnectionError: If connection fails
+            VectorDatabaseConnectionError: If connection fails or dimensions differ
+
+        Note:
+            Calling this is optional; every operation initializes the
+            adapter on first use.
         """
+        if expected_dim is not None:
+            # Remembered so a later lazy initialization checks it too
+            self._expected_dim = expected_dim
+
+        # Checked before connecting, so a misconfigured adapter never
+        # creates an index with the wrong dimension
+        if expected_dim is not None and expected_dim != self.dimension:
+            raise VectorDatabaseConnectionError(
+                f"Embedding dimension {expected_dim} does not match "
+                f"configured index dimension {self.dimension}"
+            )
+
         try:
-            # Initialize Pinecone client
-            self.pc = Pinecone(api_key=self.api_key)
-
-            # Check if index exists
-            existing_indexes = [index.name for index in self.pc.list_indexes()]
-
-            if self.index_name not in existing_indexes:
-                logger.info(f"Creating new Pinecone index: {self.index_name}")
-
-                # Create serverless index (free tier)
-                self.pc.create_index(
-                    name=self.index_name,
-                    dimension=self.dimension,
-                    metric=self.metric,
-                    spec=ServerlessSpec(
-                        cloud=self.cloud,
-                        region=self.region
-                    )
+            # The SDK calls block on network I/O, so setup runs in a thread
+            index_dim = await asyncio.to_thread(self._connect)
+            self._last_ok = time.monotonic()
+            logger.info(f"Connected to Pinecone index '{self.index_name}' (dimension {index_dim})")
+
+            # An existing index keeps the dimension it was created with
+            if expected_dim is not None and index_dim and index_dim != expected_dim:
+                self.index = None
+                raise VectorDatabaseConnectionError(
+                    f"Embedding dimension {expected_dim} does not match "
+                    f"index '{self.index_name}' dimension {index_dim}"
                 )
 
-                logger.info(f"Index '{self.index_name}' created successfully")
-            else:
-                logger.info(f"Index '{self.index_name}' already exists")
-
-            # Connect to index
-            self.index = self.pc.Index(self.index_name)
-
-            # Verify connection
-            stats = self.index.describe_index_stats()
-            logger.info(f"Connected to Pinecone index. Stats: {stats}")
-
+        except VectorDatabaseConnectionError:
+            raise
         except Exception as e:
             logger.error(f"Failed to initialize Pinecone: {e}")
             raise VectorDatabaseConnectionError(f"Pinecone initialization failed: {e}")
 
-    def _sanitize_metadata(self, metadata: Dict) -> Dict:
+    async def _ensure_initialized(self) -> None:
         """
-        Sanitize metadata for Pinecone compatibility.
+        Initialize on first use.
 
-        Pinecone requirements:
-        - All values must be JSON-serializable (str, int, float, bool, list of primitives)
-        - No nested dicts
-        - No datetime objects
-        - No null/None values
-        - String values must be <40KB
+        Concurrent first callers wait on a single initialize() call rather
+        than each connecting.
+        """
+        if self.index is not None:
+            return
 
-        Args:
-            metadata: Raw metadata dict
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+
+        async with self._init_lock:
+            if self.index is None:
+                await self.initialize(self._expected_dim)
+
+    def _connect(self) -> int:
+        """
+        Connect to Pinecone, creating the index if needed (blocking).
 
         Returns:
-            Sanitized metadata dict
+            Dimension of the index
         """
-        sanitized = {}
-        for key, value in metadata.items():
-            # Skip None values - Pinecone doesn't accept null
-            if value is None:
-                continue
-            # Convert datetime to ISO string
-            elif hasattr(value, 'isoformat'):
-                sanitized[key] = value.isoformat()
-            # Handle primitive types
-            elif isinstance(value, (str, int, float, bool)):
-                # Truncate long strings to avoid Pinecone limits
-                if isinstance(value, str) and len(value) > 40000:
-                    sanitized[key] = value[:40000]
-                else:
-                    sanitized[key] = value
-            elif isinstance(value, list):
-                # Only keep lists of primitives (no None values in list)
-                if all(isinstance(v, (str, int, float, bool)) and v is not None for v in value):
-                    sanitized[key] = value
-                else:
-                    sanitized[key] = str(value)
-            else:
-                # Convert complex objects to strings
-                sanitized[key] = str(value)
-
-        return sanitized
+        # Initialize Pinecone client, reused for the adapter's lifetime
+        self.pc = Pinecone(api_key=self.api_key)
+
+        # Check if index exists with a single describe call rather than
+        # listing every index in the project. The description carries the
+        # dimension and host, so nothing else needs to be fetched
+        try:
+            description = self.pc.describe_index(self.index_name)
+            logger.info(f"Index '{self.index_name}' already exists")
+        except NotFoundException:
+            logger.info(f"Creating new Pinecone index: {self.index_name}")
+
+            # Create serverless index (free tier)
+            self.pc.create_index(
+                name=self.index_name,
+                dimension=self.dimension,
+                metric=self.metric,
+                spec=ServerlessSpec(
+                    cloud=self.cloud,
+                    region=self.region
+                )
+            )
+
+            logger.info(f"Index '{self.index_name}' created successfully")
+            description = self.pc.describe_index(self.index_name)
+
+        # Upserts run as concurrent to_thread calls, so the urllib3 pool must
+        # hold at least upsert_concurrency keep-alive connections or the
+        # extras are opened and discarded on every batch. Pinecone.Index()
+        # drops a connection_pool_maxsize kwarg, so the pool size goes in
+        # through the OpenAPI configuration instead
+        openapi_config = OpenApiConfiguration()
+        openapi_config.connection_pool_maxsize = self.upsert_concurrency
+
+        # Connect to index by host, which skips the describe call that
+        # Index(name) would otherwise make to resolve it
+        self.index = Index(
+            host=description.host,
+            api_key=self.api_key,
+            openapi_config=openapi_config
+        )
+
+        return description.dimension
 
     async def upsert_vectors(
         self,
         ids: List[str],
-        vectors: List[List[float]],
+        vectors: Union[List[List[float]], np.ndarray],
         metadata: List[Dict]
     ) -> int:
         """
@@ -166,7 +298,7 @@ class PineconeAdapter(VectorDatabaseInterface):
 
         Args:
             ids: List of unique IDs
-            vectors: List of embedding vectors
+            vectors: List of embedding vectors or (n, dim) float32/int8 array
             metadata: List of metadata dicts (must include 'content' field)
 
         Returns:
@@ -180,31 +312,50 @@ class PineconeAdapter(VectorDatabaseInterface):
             Each metadata dict should have a 'content' field.
         """
         try:
-            if not self.index:
-                raise VectorDatabaseError("Index not initialized. Call initialize() first.")
+            await self._ensure_initialized()
 
             if not (len(ids) == len(vectors) == len(metadata)):
                 raise ValueError("ids, vectors, and metadata must have the same length")
 
-            # Prepare vectors for Pinecone format
-            # Pinecone expects: [(id, vector, metadata), ...]
-            # Sanitize metadata to ensure Pinecone compatibility
-            vectors_to_upsert = [
-                (id, vector, self._sanitize_metadata(meta))
-                for id, vector, meta in zip(ids, vectors, metadata)
-            ]
-
-            # Upsert in batches (Pinecone recommends batch size of 100-1000)
-            batch_size = 100
-            total_upserted = 0
-
-            for i in range(0, len(vectors_to_upsert), batch_size):
-                batch = vectors_to_upsert[i:i + batch_size]
-                response = self.index.upsert(vectors=batch)
-                total_upserted += response.upserted_count
-
-                logger.debug(f"Upserted batch {i // batch_size + 1}: {len(batch)} vectors")
+            # Lists of lists are packed into one float32 array up front, so
+            # batches below are cheap views rather than copies. Quantized
+            # int8 arrays become integral floats, which stay short on the wire
+            vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+
+            # Upsert in batches (Pinecone recommends batch size of 100-1000).
+            # The client call blocks, so each batch runs in a worker thread
+            # and several requests are in flight at once
+            batch_size = self.upsert_batch_size
+            semaphore = asyncio.Semaphore(self.upsert_concurrency)
+
+            async def _send(start: int) -> int:
+                end = start + batch_size
+                async with semaphore:
+                    upserted = await asyncio.to_thread(
+                        self._upsert_batch,
+                        ids[start:end],
+                        vectors[start:end],
+                        metadata[start:end]
+                    )
+                logger.debug(f"Upserted batch: {upserted} vectors")
+                return upserted
+
+            responses = await asyncio.gather(*[
+                _send(start) for start in range(0, len(ids), batch_size)
+            ], return_exceptions=True)
+
+            # Every batch is allowed to finish so the error can report how
+            # much was written
+            total_upserted = sum(r for r in responses if not isinstance(r, BaseException))
+            self.write_version += 1
+            errors = [r for r in responses if isinstance(r, BaseException)]
+            if errors:
+                raise VectorDatabaseOperationError(
+                    f"{len(errors)} of {len(responses)} batches failed "
+                    f"({total_upserted} vectors upserted): {errors[0]}"
+                )
 
+            self._last_ok = time.monotonic()
             logger.info(f"Successfully upserted {total_upserted} vectors to Pinecone")
             return total_upserted
 
@@ -212,11 +363,39 @@ class PineconeAdapter(VectorDatabaseInterface):
             logger.error(f"Failed to upsert vectors to Pinecone: {e}")
             raise VectorDatabaseOperationError(f"Upsert failed: {e}")
 
+    def _upsert_batch(
+        self,
+        ids: List[str],
+        vectors: np.ndarray,
+        metadata: List[Dict]
+    ) -> int:
+        """
+        Build and send one upsert request (blocking, run in a worker thread).
+
+        Conversion and sanitization happen here so their CPU cost stays off
+        the event loop and only one batch of Python floats exists at a time.
+
+        Returns:
+            Number of vectors upserted. Only the count leaves the worker, so
+            gathered batches never hold their response objects
+        """
+        # Pinecone expects: [(id, vector, metadata), ...]. Its client
+        # serializes lists of floats, so the array view is converted in one
+        # C-level tolist() pass
+        batch = list(zip(
+            ids,
+            vectors.tolist(),
+            # Sanitize metadata to ensure Pinecone compatibility
+            [_sanitize_metadata(meta) for meta in metadata]
+        ))
+        return self.index.upsert(vectors=batch).upserted_count
+
     async def search(
         self,
-        query_vector: List[float],
+        query_vector: Union[List[float], np.ndarray],
         top_k: int = 5,
-        filter: Optional[Dict] = None
+        filter: Optional[Dict] = None,
+        score_threshold: Optional[float] = None
     ) -> List[VectorSearchResult]:
         """
         Search for similar vectors in Pinecone.
@@ -225,6 +404,7 @@ class PineconeAdapter(VectorDatabaseInterface):
             query_vector: Query embedding vector
             top_k: Number of results to return
             filter: Optional metadata filter
+            score_threshold: Minimum similarity score to return
 
         Returns:
             List of VectorSearchResult objects
@@ -237,8 +417,13 @@ class PineconeAdapter(VectorDatabaseInterface):
             {"instructor": "Dr. Smith", "semester": "Fall 2024"}
         """
         try:
-            if not self.index:
-                raise VectorDatabaseError("Index not initialized. Call initialize() first.")
+            await self._ensure_initialized()
+
+            # The Pinecone client validates vectors as lists of floats;
+            # ndarray.tolist() converts in one C-level pass. float32 keeps
+            # the serialized values to single precision
+            if isinstance(query_vector, np.ndarray):
+                query_vector = query_vector.astype(np.float32, copy=False).tolist()
 
             # Prepare query
             query_params = {
@@ -251,21 +436,29 @@ class PineconeAdapter(VectorDatabaseInterface):
                 query_params["filter"] = filter
 
             # Execute search
-            response = self.index.query(**query_params)
-
-            # Convert to VectorSearchResult objects
-            results = []
-            for match in response.matches:
-                # Extract content from metadata
-                content = match.metadata.get("content", "")
-
-                result = VectorSearchResult(
-                    id=match.id,
-                    content=content,
-                    metadata=match.metadata,
-                    similarity_score=match.score
+            response = await asyncio.to_thread(self.index.query, **query_params)
+            self._last_ok = time.monotonic()
+
+            # Convert the response to plain dicts once, instead of going
+            # through the SDK model's attribute accessors for every field
+            matches = response.to_dict().get("matches") or []
+
+            # Pinecone has no server-side score cutoff, so matches below the
+            # threshold are dropped before any result objects are built
+            if score_threshold is not None:
+                matches = [m for m in matches if m["score"] >= score_threshold]
+
+            # Convert to VectorSearchResult objects, extracting content from
+            # metadata
+            results = [
+                VectorSearchResult(
+                    id=m["id"],
+                    content=(m.get("metadata") or {}).get("content", ""),
+                    metadata=m.get("metadata") or {},
+                    similarity_score=m["score"]
                 )
-                results.append(result)
+                for m in matches
+            ]
 
             logger.info(f"Found {len(results)} results for query")
             return results
@@ -288,10 +481,10 @@ class PineconeAdapter(VectorDatabaseInterface):
             VectorDatabaseOperationError: If deletion fails
         """
         try:
-            if not self.index:
-                raise VectorDatabaseError("Index not initialized. Call initialize() first.")
+            await self._ensure_initialized()
 
-            self.index.delete(ids=ids)
+            await asyncio.to_thread(self.index.delete, ids=ids)
+            self.write_version += 1
             logger.info(f"Deleted {len(ids)} vectors from Pinecone")
             return len(ids)
 
@@ -316,10 +509,10 @@ class PineconeAdapter(VectorDatabaseInterface):
             Pinecone filter-based deletion doesn't return the count of deleted vectors.
         """
         try:
-            if not self.index:
-                raise VectorDatabaseError("Index not initialized. Call initialize() first.")
+            await self._ensure_initialized()
 
-            self.index.delete(filter=filter)
+            await asyncio.to_thread(self.index.delete, filter=filter)
+            self.write_version += 1
             logger.info(f"Deleted vectors matching filter: {filter}")
             return 0  # Pinecone doesn't return deletion count for filter-based deletes
 
@@ -335,10 +528,10 @@ class PineconeAdapter(VectorDatabaseInterface):
             Dict with index statistics
         """
         try:
-            if not self.index:
-                raise VectorDatabaseError("Index not initialized. Call initialize() first.")
+            await self._ensure_initialized()
 
-            stats = self.index.describe_index_stats()
+            stats = await asyncio.to_thread(self.index.describe_index_stats)
+            self._last_ok = time.monotonic()
 
             return {
                 "total_vectors": stats.total_vector_count,
@@ -359,11 +552,16 @@ class PineconeAdapter(VectorDatabaseInterface):
             True if healthy, False otherwise
         """
         try:
-            if not self.index:
-                return False
+            await self._ensure_initialized()
+
+            # A call that succeeded moments ago is proof enough; frequent
+            # liveness probes shouldn't each cost a round-trip
+            if time.monotonic() - self._last_ok < self.HEALTH_CHECK_TTL:
+                return True
 
             # Try to get index stats as a health check
-            self.index.describe_index_stats()
+            await asyncio.to_thread(self.index.describe_index_stats)
+            self._last_ok = time.monotonic()
             return True
 
         except Exception as e:
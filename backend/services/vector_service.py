@@ -3,9 +3,15 @@ Vector database service for semantic search over academic papers.
 Supports ChromaDB (local) and Pinecone (cloud).
 """
 import chromadb
-from chromadb.config import Settings
+from collections import OrderedDict
 from typing import List, Dict, Optional, Tuple
+import asyncio
+import hashlib
+import json
 import logging
+import time
+
+import numpy as np
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -14,6 +20,10 @@ logger = logging.getLogger(__name__)
 @dataclass
 class SearchResult:
     """Vector search result."""
+    # Created once per search hit, so instances skip the per-object __dict__.
+    # Declared by hand since dataclass(slots=True) needs Python 3.10
+    __slots__ = ('paper_id', 'title', 'abstract', 'similarity_score', 'metadata')
+
     paper_id: str
     title: str
     abstract: str
@@ -30,6 +40,21 @@ class SearchResult:
         }
 
 
+def _title_and_abstract(document: str, metadata: Dict) -> Tuple[str, str]:
+    """
+    Read a stored paper's title and abstract.
+
+    The title lives in metadata and the document is the abstract. Papers
+    stored before that split have a "title\n\nabstract" document, whose
+    title prefix is stripped.
+    """
+    title = metadata.get("title", "")
+    prefix = f"{title}\n\n"
+    if document.startswith(prefix):
+        return title, document[len(prefix):]
+    return title, document
+
+
 class VectorServiceError(Exception):
     """Vector service errors."""
     pass
@@ -43,6 +68,10 @@ class VectorService:
     in production.
     """
 
+    # Recent search results, reused for repeated identical queries
+    SEARCH_CACHE_SIZE = 1024
+    SEARCH_CACHE_TTL = 60.0  # seconds
+
     def __init__(
         self,
         collection_name: str = "research_papers",
@@ -55,14 +84,14 @@ class VectorService:
             collection_name: Name of the collection
             persist_directory: Local storage directory for ChromaDB
         """
+        # (query digest, n_results, where) -> (expiry, results)
+        self._search_cache: "OrderedDict[Tuple, Tuple[float, List[SearchResult]]]" = OrderedDict()
+
         try:
-            # Initialize ChromaDB client with persistence
-            self.client = chromadb.Client(
-                Settings(
-                    chroma_db_impl="duckdb+parquet",
-                    persist_directory=persist_directory
-                )
-            )
+            # Initialize ChromaDB client with persistence. PersistentClient
+            # uses the SQLite + native HNSW backend and writes through, so
+            # no explicit persist step is needed
+            self.client = chromadb.PersistentClient(path=persist_directory)
 
             # Get or create collection
             self.collection = self.client.get_or_create_collection(
@@ -95,24 +124,26 @@ class VectorService:
             metadata: Additional metadata (authors, year, venue, etc.)
         """
         try:
-            # Prepare document text (title + abstract for better search)
-            document_text = f"{title}\n\n{abstract}"
+            # The abstract is the document; the title is kept in metadata
+            # so it never has to be split back out
+            document_text = abstract
 
-            # Prepare metadata
-            paper_metadata = metadata or {}
-            paper_metadata.update({
-                "title": title,
-                "paper_id": paper_id
-            })
+            # Prepare metadata (copied so the caller's dict isn't modified)
+            paper_metadata = dict(metadata or {})
+            paper_metadata["title"] = title
+            paper_metadata["paper_id"] = paper_id
 
             # Add to collection
-            self.collection.add(
+            await asyncio.to_thread(
+                self.collection.add,
                 ids=[paper_id],
                 embeddings=[embedding],
                 documents=[document_text],
                 metadatas=[paper_metadata]
             )
 
+            # Cached searches may no longer reflect the collection
+            self._search_cache.clear()
             logger.info(f"Added paper to vector DB: {paper_id}")
 
         except Exception as e:
@@ -121,43 +152,54 @@ class VectorService:
 
     async def add_papers_batch(
         self,
-        papers: List[Dict]
+        papers: List[Dict],
+        batch_size: int = 1000
     ) -> int:
         """
         Add multiple papers in batch for better performance.
 
+        Papers are written in sub-batches, so only one sub-batch of
+        documents and embeddings is materialized at a time.
+
         Args:
             papers: List of paper dicts with keys: paper_id, title, abstract, embedding, metadata
+            batch_size: Papers per collection.add call
 
         Returns:
             Number of papers added
         """
         try:
-            ids = [p["paper_id"] for p in papers]
-            embeddings = [p["embedding"] for p in papers]
-            documents = [
-                f"{p['title']}\n\n{p['abstract']}"
-                for p in papers
-            ]
-            metadatas = []
-
-            for p in papers:
-                meta = p.get("metadata", {})
-                meta.update({
-                    "title": p["title"],
-                    "paper_id": p["paper_id"]
-                })
-                metadatas.append(meta)
-
-            self.collection.add(
-                ids=ids,
-                embeddings=embeddings,
-                documents=documents,
-                metadatas=metadatas
-            )
+            added = 0
+            for start in range(0, len(papers), batch_size):
+                batch = papers[start:start + batch_size]
+
+                # One pass over the batch fills every column
+                ids, embeddings, documents, metadatas = [], [], [], []
+                for p in batch:
+                    ids.append(p["paper_id"])
+                    embeddings.append(p["embedding"])
+                    documents.append(p["abstract"])
+                    # Copied so the caller's metadata dict isn't modified
+                    meta = dict(p.get("metadata") or {})
+                    meta["title"] = p["title"]
+                    meta["paper_id"] = p["paper_id"]
+                    metadatas.append(meta)
+
+                # ChromaDB indexes synchronously, so the write runs in a thread
+                await asyncio.to_thread(
+                    self.collection.add,
+                    ids=ids,
+                    embeddings=embeddings,
+                    documents=documents,
+                    metadatas=metadatas
+                )
 
-            logger.info(f"Added {len(papers)} papers to vector DB")
-            return len(papers)
+                added += len(batch)
+                logger.debug(f"Added batch of {len(batch)} papers ({added}/{len(papers)})")
+
+            self._search_cache.clear()
+            logger.info(f"Added {added} papers to vector DB")
+            return added
 
         except Exception as e:
             logger.error(f"Batch add failed: {e}")
@@ -188,31 +230,41 @@ class VectorService:
             )
         """
         try:
+            # Only used to key the cache; Chroma gets the caller's list as-is
+            query_array = np.ascontiguousarray([query_embedding], dtype=np.float32)
+
+            # Retries and pagination repeat the exact same query within
+            # seconds; serve those from the cache without touching Chroma
+            cache_key = self._search_cache_key(query_array, n_results, where)
+            cached = self._search_cache_get(cache_key)
+            if cached is not None:
+                return cached
+
             query_params = {
                 "query_embeddings": [query_embedding],
-                "n_results": n_results
+                "n_results": n_results,
+                # Only what's parsed below; embeddings are never returned
+                "include": ["documents", "metadatas", "distances"]
             }
 
             if where:
                 query_params["where"] = where
 
-            results = self.collection.query(**query_params)
+            results = await asyncio.to_thread(self.collection.query, **query_params)
+
+            # Convert distances to similarity scores (0-1, higher is better)
+            # in one vectorized op; tolist() hands back plain Python floats
+            similarities = (1.0 - np.minimum(np.asarray(results["distances"][0]), 1.0)).tolist()
 
             # Parse results
             search_results = []
-            for i in range(len(results["ids"][0])):
-                paper_id = results["ids"][0][i]
-                document = results["documents"][0][i]
-                distance = results["distances"][0][i]
-                metadata = results["metadatas"][0][i]
-
-                # Convert distance to similarity score (0-1, higher is better)
-                similarity_score = 1.0 - min(distance, 1.0)
-
-                # Extract title and abstract from document
-                parts = document.split("\n\n", 1)
-                title = parts[0] if len(parts) > 0 else ""
-                abstract = parts[1] if len(parts) > 1 else ""
+            for paper_id, document, metadata, similarity_score in zip(
+                results["ids"][0],
+                results["documents"][0],
+                results["metadatas"][0],
+                similarities
+            ):
+                title, abstract = _title_and_abstract(document, metadata)
 
                 search_results.append(SearchResult(
                     paper_id=paper_id,
@@ -223,12 +275,47 @@ class VectorService:
                 ))
 
             logger.info(f"Found {len(search_results)} similar papers")
+            self._search_cache_put(cache_key, search_results)
             return search_results
 
         except Exception as e:
             logger.error(f"Search failed: {e}")
             raise VectorServiceError(f"Search failed: {e}")
 
+    @staticmethod
+    def _search_cache_key(
+        query_array: np.ndarray,
+        n_results: int,
+        where: Optional[Dict]
+    ) -> Tuple:
+        """Build the search cache key from the query vector's bytes and filters."""
+        digest = hashlib.blake2b(query_array.tobytes(), digest_size=16).digest()
+        # Filters can nest ($and/$or lists), so they're keyed by canonical JSON
+        where_key = json.dumps(where, sort_keys=True, default=str) if where else None
+        return (digest, n_results, where_key)
+
+    def _search_cache_get(self, key: Tuple) -> Optional[List[SearchResult]]:
+        """Return unexpired cached results for key, or None."""
+        entry = self._search_cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, results = entry
+        if expires_at < time.monotonic():
+            del self._search_cache[key]
+            return None
+
+        self._search_cache.move_to_end(key)
+        # A new list, so callers can't reorder or trim the cached one
+        return list(results)
+
+    def _search_cache_put(self, key: Tuple, results: List[SearchResult]) -> None:
+        """Cache results for key, evicting the least recently used entry."""
+        self._search_cache[key] = (time.monotonic() + self.SEARCH_CACHE_TTL, list(results))
+        self._search_cache.move_to_end(key)
+        if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+
     async def get_paper(self, paper_id: str) -> Optional[SearchResult]:
         """
         Get a specific paper by ID.
@@ -240,7 +327,8 @@ class VectorService:
             Search result or None if not found
         """
         try:
-            results = self.collection.get(
+            results = await asyncio.to_thread(
+                self.collection.get,
                 ids=[paper_id],
                 include=["documents", "metadatas"]
             )
@@ -251,9 +339,7 @@ class VectorService:
             document = results["documents"][0]
             metadata = results["metadatas"][0]
 
-            parts = document.split("\n\n", 1)
-            title = parts[0] if len(parts) > 0 else ""
-            abstract = parts[1] if len(parts) > 1 else ""
+            title, abstract = _title_and_abstract(document, metadata)
 
             return SearchResult(
                 paper_id=paper_id,
@@ -278,17 +364,18 @@ class VectorService:
             True if deleted, False otherwise
         """
         try:
-            self.collection.delete(ids=[paper_id])
+            await asyncio.to_thread(self.collection.delete, ids=[paper_id])
+            self._search_cache.clear()
             logger.info(f"Deleted paper: {paper_id}")
             return True
         except Exception as e:
             logger.error(f"Failed to delete paper {paper_id}: {e}")
             return False
 
-    def get_collection_stats(self) -> Dict:
+    async def get_collection_stats(self) -> Dict:
         """Get statistics about the collection."""
         try:
-            count = self.collection.count()
+            count = await asyncio.to_thread(self.collection.count)
             return {
                 "total_papers": count,
                 "collection_name": self.collection.name
@@ -298,9 +385,10 @@ class VectorService:
             return {"error": str(e)}
 
     def persist(self):
-        """Persist the database to disk (ChromaDB only)."""
-        try:
-            self.client.persist()
-            logger.info("Vector database persisted to disk")
-        except Exception as e:
-            logger.error(f"Failed to persist: {e}")
+        """
+        Persist the database to disk (ChromaDB only).
+
+        Kept for compatibility: PersistentClient writes every change
+        through to disk, so there is nothing to flush.
+        """
+        pass
@@ -5,14 +5,40 @@ Design Pattern: Service Layer Pattern
 Purpose: Encapsulate Voxtral API calls for voice-to-text transcription
 """
 import httpx
+import json
 import logging
 import os
+import xxhash
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 from pathlib import Path
-import tempfile
 
 logger = logging.getLogger(__name__)
 
+# Shared by every VoxtralService so warm connections to the API survive
+# per-request service instances
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+
+    Returns:
+        Pooled HTTP/2 AsyncClient
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=60.0,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50
+            )
+        )
+    return _shared_client
+
 
 class VoxtralService:
     """
@@ -21,16 +47,22 @@ class VoxtralService:
     Uses Voxtral Mini for cost-efficient, high-quality transcription.
 
     Attributes:
-        client: httpx AsyncClient instance
+        client: httpx AsyncClient shared by all instances
         model: Voxtral model to use (default: voxtral-mini-latest)
         api_base_url: Mistral API base URL
     """
 
+    # How long a transcription stays cached in Redis
+    TRANSCRIPTION_CACHE_TTL = 7 * 24 * 3600  # 7 days
+    # Recent transcriptions kept in process, in front of Redis
+    LOCAL_CACHE_SIZE = 256
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         api_base_url: str = "https://api.mistral.ai/v1",
-        model: str = "voxtral-mini-latest"
+        model: str = "voxtral-mini-latest",
+        redis_url: Optional[str] = None
     ):
         """
         Initialize Voxtral service.
@@ -39,6 +71,8 @@ class VoxtralService:
             api_key: Mistral API key (defaults to MISTRAL_API_KEY env var)
             api_base_url: Mistral API base URL
             model: Voxtral model name (default: voxtral-mini-latest)
+            redis_url: Redis used to cache transcriptions by audio content
+                       (defaults to REDIS_URL env var; caching is off if unset)
         """
         self.api_key = api_key or os.getenv("MISTRAL_API_KEY")
 
@@ -47,18 +81,88 @@ class VoxtralService:
 
         self.api_base_url = api_base_url
         self.model = model
-        self.client = httpx.AsyncClient(
-            timeout=60.0,
-            headers={
-                "Authorization": f"Bearer {self.api_key}"
-            }
-        )
+        self.client = _get_shared_client()
+        # Sent per request since the client is shared across API keys
+        self._headers = {"Authorization": f"Bearer {self.api_key}"}
+
+        self._cache = self._connect_cache(redis_url or os.getenv("REDIS_URL"))
+        # cache key -> transcription, least recently used first
+        self._local_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
 
-        logger.info(f"VoxtralService initialized with model: {self.model}")
+        logger.info("VoxtralService initialized with model: %s", self.model)
+
+    @staticmethod
+    def _connect_cache(redis_url: Optional[str]):
+        """Create the Redis transcription cache client, or None if unavailable."""
+        if not redis_url:
+            return None
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            logger.warning("redis is not installed; transcriptions will not be cached")
+            return None
+        return aioredis.from_url(redis_url)
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """
+        Close the cache connection.
+
+        The shared HTTP client stays open for other instances.
+        """
+        if self._cache is not None:
+            await self._cache.aclose()
+
+    def _cache_key(self, audio_bytes: bytes, language: Optional[str]) -> str:
+        """
+        Build the cache key for a transcription request.
+
+        The whole clip is hashed; sampled hashes collide across similar clips.
+        xxh3-128 is fast enough to hash multi-megabyte uploads per request.
+        """
+        digest = xxhash.xxh3_128_hexdigest(audio_bytes)
+        return f"voxtral:{digest}:{len(audio_bytes)}:{language or 'auto'}:{self.model}"
+
+    def _remember(self, key: str, result: Dict[str, Any]) -> None:
+        """Record a transcription in the in-process LRU."""
+        self._local_cache[key] = result
+        self._local_cache.move_to_end(key)
+        if len(self._local_cache) > self.LOCAL_CACHE_SIZE:
+            self._local_cache.popitem(last=False)
+
+    async def _get_cached(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached transcription, in process first, then in Redis.
+
+        Cache failures count as misses.
+        """
+        local = self._local_cache.get(key)
+        if local is not None:
+            self._local_cache.move_to_end(key)
+            return dict(local)
+
+        if self._cache is None:
+            return None
+        try:
+            cached = await self._cache.get(key)
+        except Exception as e:
+            logger.warning("Transcription cache read failed: %s", e)
+            return None
+        if not cached:
+            return None
+
+        result = json.loads(cached)
+        self._remember(key, result)
+        return dict(result)
+
+    async def _set_cached(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a transcription; failures are logged and otherwise ignored."""
+        self._remember(key, dict(result))
+        if self._cache is None:
+            return
+        try:
+            await self._cache.set(key, json.dumps(result), ex=self.TRANSCRIPTION_CACHE_TTL)
+        except Exception as e:
+            logger.warning("Transcription cache write failed: %s", e)
 
     async def transcribe_audio(
         self,
@@ -68,6 +172,9 @@ class VoxtralService:
         """
         Transcribe audio file to text.
 
+        Identical audio (same bytes, language and model) transcribed recently
+        is returned from the in-process or Redis cache without an API call.
+
         Args:
             audio_path: Path to audio file (webm, mp3, wav, etc.)
             language: Optional language code (auto-detected if not provided)
@@ -85,35 +192,85 @@ class VoxtralService:
             result = await service.transcribe_audio("recording.webm")
             print(result['text'])
         """
+        logger.info("Transcribing audio file: %s", audio_path)
+
         try:
-            logger.info(f"Transcribing audio file: {audio_path}")
+            # Read the file once; the same bytes are hashed for the cache
+            # key and sent in the upload
+            with open(audio_path, 'rb') as audio_file:
+                audio_bytes = audio_file.read()
+        except OSError as e:
+            logger.error("Failed to read audio file: %s", e)
+            raise Exception(f"Failed to transcribe audio: {str(e)}")
+
+        return await self.transcribe_audio_bytes(
+            audio_bytes,
+            filename=Path(audio_path).name,
+            language=language
+        )
+
+    async def transcribe_audio_bytes(
+        self,
+        audio_bytes: bytes,
+        filename: str = "audio.webm",
+        language: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Transcribe audio from bytes.
+
+        The bytes are sent directly as the multipart file part, so callers
+        that already hold the upload in memory need no temporary file.
 
+        Args:
+            audio_bytes: Audio file bytes
+            filename: Original filename (for file type detection)
+            language: Optional language code
+
+        Returns:
+            Dictionary with transcription results
+
+        Raises:
+            Exception: If transcription fails
+
+        Example:
+            result = await service.transcribe_audio_bytes(
+                audio_data,
+                filename="recording.webm"
+            )
+        """
+        try:
             url = f"{self.api_base_url}/audio/transcriptions"
 
+            cache_key = self._cache_key(audio_bytes, language)
+            cached = await self._get_cached(cache_key)
+            if cached is not None:
+                logger.info("Transcription served from cache")
+                return cached
+
             # Prepare multipart form data
-            with open(audio_path, 'rb') as audio_file:
-                files = {
-                    'file': (Path(audio_path).name, audio_file, 'audio/webm')
-                }
-                data = {
-                    'model': self.model
-                }
-
-                # Add language if specified
-                if language:
-                    data['language'] = language
-
-                # Make API request
-                response = await self.client.post(
-                    url,
-                    files=files,
-                    data=data
-                )
+            files = {
+                'file': (filename, audio_bytes, 'audio/webm')
+            }
+            data = {
+                'model': self.model
+            }
+
+            # Add language if specified
+            if language:
+                data['language'] = language
+
+            # Make API request
+            response = await self.client.post(
+                url,
+                files=files,
+                data=data,
+                headers=self._headers
+            )
 
             # Check response status
             if response.status_code != 200:
                 error_text = response.text
-                logger.error(f"Voxtral API error: {response.status_code} - {error_text}")
+                logger.error("Voxtral API error: %s - %s", response.status_code, error_text)
                 raise Exception(
                     f"API request failed with status {response.status_code}: {error_text}"
                 )
@@ -126,73 +283,28 @@ class VoxtralService:
                 raise Exception("No transcription text received from API")
 
             logger.info(
-                f"Transcription successful: {len(transcription_text)} characters"
+                "Transcription successful: %d characters", len(transcription_text)
             )
 
-            return {
+            transcription = {
                 'text': transcription_text,
                 'language': result.get('language', language or 'auto'),
                 'model': self.model
             }
+            await self._set_cached(cache_key, transcription)
+
+            return transcription
 
         except httpx.TimeoutException as e:
-            logger.error(f"Transcription timeout: {e}")
+            logger.error("Transcription timeout: %s", e)
             raise Exception("Request to Voxtral API timed out")
         except httpx.RequestError as e:
-            logger.error(f"Transcription request error: {e}")
+            logger.error("Transcription request error: %s", e)
             raise Exception(f"Failed to connect to Voxtral API: {str(e)}")
         except Exception as e:
-            logger.error(f"Transcription failed: {e}", exc_info=True)
+            logger.error("Transcription failed: %s", e, exc_info=True)
             raise Exception(f"Failed to transcribe audio: {str(e)}")
 
-    async def transcribe_audio_bytes(
-        self,
-        audio_bytes: bytes,
-        filename: str = "audio.webm",
-        language: Optional[str] = None
-    ) -> Dict[str, Any]:
-        """
-        Transcribe audio from bytes.
-
-        Creates a temporary file to store audio bytes for API call.
-
-        Args:
-            audio_bytes: Audio file bytes
-            filename: Original filename (for file type detection)
-            language: Optional language code
-
-        Returns:
-            Dictionary with transcription results
-
-        Example:
-            result = await service.transcribe_audio_bytes(
-                audio_data,
-                filename="recording.webm"
-            )
-        """
-        # Create temporary file
-        suffix = Path(filename).suffix or '.webm'
-
-        with tempfile.NamedTemporaryFile(
-            mode='wb',
-            suffix=suffix,
-            delete=False
-        ) as temp_file:
-            temp_file.write(audio_bytes)
-            temp_path = temp_file.name
-
-        try:
-            # Transcribe temporary file
-            result = await self.transcribe_audio(temp_path, language)
-            return result
-
-        finally:
-            # Clean up temporary file
-            try:
-                os.unlink(temp_path)
-            except Exception as e:
-                logger.warning(f"Failed to delete temp file: {e}")
-
     def is_available(self) -> bool:
         """
         Check if Voxtral service is properly configured.
@@ -1,14 +1,36 @@
 """
 Celery application configuration for background tasks.
 Handles scheduled jobs like paper fetching and email digests.
+
+Network-bound tasks run on the "fast" queue; summarization runs on a small
+"slow" queue so it can't hold up alerts and fetches:
+    celery -A backend.tasks.celery_app worker -P prefork -c 8 -Q fast
+    celery -A backend.tasks.celery_app worker -P prefork -c 2 -Q slow
+
+The tasks drive async services with asyncio.run(), which needs each task on
+its own OS thread, so green-thread pools (eventlet/gevent) must not be used;
+"-P threads" works too if lower memory matters more than isolation.
 """
 from celery import Celery
 from celery.schedules import crontab
+from kombu import Queue
+from kombu.serialization import register
+import orjson
 import os
 
 # Get Redis URL from environment
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+# orjson encodes task payloads and results (e.g. long summary texts) much
+# faster than the stdlib json serializer
+register(
+    "orjson",
+    lambda obj: orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY),
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="utf-8",
+)
+
 # Initialize Celery app
 celery_app = Celery(
     "insights_tasks",
@@ -22,15 +44,45 @@ celery_app = Celery(
 
 # Celery configuration
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    task_serializer="orjson",
+    # Plain json still accepted for messages queued before the switch
+    accept_content=["orjson", "json"],
+    result_serializer="orjson",
+    result_accept_content=["orjson", "json"],
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes max per task
-    worker_prefetch_multiplier=4,
+    # Each worker process takes one task at a time; a higher multiplier lets
+    # one worker hoard tasks that idle workers elsewhere could run
+    worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=1000,
+    # Reuse broker connections across publishes instead of reconnecting
+    broker_pool_limit=20,
+    broker_transport_options={"socket_keepalive": True},
+    task_queues=(
+        Queue("fast"),
+        Queue("slow"),
+    ),
+    task_default_queue="fast",
+    task_routes={
+        # Dominated by HTTP round-trips (Semantic Scholar, Mistral, email)
+        "backend.tasks.paper_tasks.fetch_new_papers": {"queue": "fast"},
+        "backend.tasks.paper_tasks.update_paper_embeddings": {"queue": "fast"},
+        "backend.tasks.notification_tasks.send_weekly_digest": {"queue": "fast"},
+        "backend.tasks.notification_tasks.send_paper_alert": {"queue": "fast"},
+        # Long-running summarization kept off the fast-queue workers
+        "backend.tasks.paper_tasks.summarize_papers_for_topic": {"queue": "slow"},
+    },
+    task_annotations={
+        # Acknowledge summarization only once it finishes, so a crashed
+        # worker's long task is redelivered rather than lost; it only reads
+        # papers and returns summaries, so rerunning it is safe
+        "backend.tasks.paper_tasks.summarize_papers_for_topic": {
+            "acks_late": True,
+            "reject_on_worker_lost": True,
+        },
+    },
 )
 
 # Scheduled tasks configuration
@@ -1,14 +1,13 @@
 """
 Background tasks for sending notifications and digests.
 """
+from celery import group
+from celery.result import GroupResult
 from backend.tasks.celery_app import celery_app
-from backend.services.email_service import EmailService, EmailConfig
-from backend.services.vector_service import VectorService
-from backend.services.paper_summarization_service import PaperSummarizationService
-from backend.config.settings import load_config
-from typing import List, Dict
+from backend.tasks.shared import get_email_service, get_vector_service, utc_now_iso
+from typing import List, Dict, Tuple
+import asyncio
 import logging
-from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
@@ -21,16 +20,8 @@ def send_weekly_digest(self):
     Runs every Monday at 8 AM UTC.
     """
     try:
-        config = load_config()
-
-        # Initialize services
-        email_service = EmailService(EmailConfig(
-            api_key=config.email.api_key,
-            from_email=config.email.from_email,
-            from_name=config.email.from_name
-        ))
-        vector_service = VectorService()
-        summarization_service = PaperSummarizationService(config.mistral.api_key)
+        # Shared per-worker service
+        email_service = get_email_service()
 
         logger.info("Starting weekly digest task")
 
@@ -44,58 +35,57 @@ def send_weekly_digest(self):
             }
         ]
 
-        total_sent = 0
-        total_failed = 0
+        # Look up papers once per distinct topic rather than once per
+        # subscriber, since many subscribers share topics
+        topics = {topic for subscriber in subscribers for topic in subscriber["topics"]}
+        papers_by_topic: Dict[str, List[Dict]] = {}
+
+        for topic in topics:
+            # Search vector DB for recent papers in this topic
+            # This would ideally filter by date metadata
+            # For now, we'll get top papers
+
+            # TODO: Implement actual search with date filtering
+            # papers = await vector_service.search_papers(
+            #     query_embedding=topic_embedding,
+            #     n_results=10,
+            #     where={"fields_of_study": topic}
+            # )
+
+            papers_by_topic[topic] = []
 
+        # Only subscribers with papers get a digest
+        recipients = []
         for subscriber in subscribers:
-            try:
-                # Get recent papers for user's topics
-                user_papers = []
-
-                for topic in subscriber["topics"]:
-                    # Search vector DB for recent papers in this topic
-                    # This would ideally filter by date metadata
-                    # For now, we'll get top papers
-
-                    # TODO: Implement actual search with date filtering
-                    # papers = await vector_service.search_papers(
-                    #     query_embedding=topic_embedding,
-                    #     n_results=10,
-                    #     where={"fields_of_study": topic}
-                    # )
-
-                    pass
-
-                # Send digest if we have papers
-                if user_papers:
-                    success = email_service.send_weekly_digest(
-                        to_email=subscriber["email"],
-                        user_name=subscriber["name"],
-                        papers=user_papers,
-                        topic=", ".join(subscriber["topics"])
-                    )
-
-                    if success:
-                        total_sent += 1
-                    else:
-                        total_failed += 1
-
-            except Exception as e:
-                logger.error(f"Failed to send digest to {subscriber['email']}: {e}")
-                total_failed += 1
-                continue
-
-        logger.info(f"Weekly digest complete: {total_sent} sent, {total_failed} failed")
+            user_papers = [
+                paper
+                for topic in subscriber["topics"]
+                for paper in papers_by_topic[topic]
+            ]
+            if user_papers:
+                recipients.append({
+                    "to_email": subscriber["email"],
+                    "user_name": subscriber["name"],
+                    "papers": user_papers,
+                    "topic": ", ".join(subscriber["topics"])
+                })
+
+        # Send the digests concurrently instead of one HTTPS call at a time
+        counts = asyncio.run(email_service.send_batch_digest(recipients))
+        total_sent = counts["sent"]
+        total_failed = counts["failed"]
+
+        logger.info("Weekly digest complete: %d sent, %d failed", total_sent, total_failed)
 
         return {
             "status": "success",
             "sent": total_sent,
             "failed": total_failed,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_now_iso()
         }
 
     except Exception as e:
-        logger.error(f"Weekly digest task failed: {e}")
+        logger.error("Weekly digest task failed: %s", e)
         # Retry once after 5 minutes
         raise self.retry(exc=e, countdown=300, max_retries=1)
 
@@ -110,27 +100,39 @@ def send_paper_alert(user_email: str, paper_id: str):
         paper_id: Paper to alert about
     """
     try:
-        config = load_config()
+        # The services are async; each task run gets its own event loop
+        return asyncio.run(_send_paper_alert(user_email, paper_id))
 
-        email_service = EmailService(EmailConfig(
-            api_key=config.email.api_key,
-            from_email=config.email.from_email,
-            from_name=config.email.from_name
-        ))
+    except Exception as e:
+        logger.error("Paper alert failed: %s", e)
+        return {"status": "failed", "error": str(e)}
 
-        vector_service = VectorService()
 
-        # Get paper details
-        paper = vector_service.get_paper(paper_id)
+async def _send_paper_alert(user_email: str, paper_id: str) -> Dict:
+    """
+    Look up a paper and email an alert about it.
+
+    Args:
+        user_email: User email address
+        paper_id: Paper to alert about
+
+    Returns:
+        Dict with the alert status
+    """
+    email_service = get_email_service()
+    vector_service = get_vector_service()
 
-        if not paper:
-            logger.error(f"Paper not found: {paper_id}")
-            return {"status": "failed", "error": "Paper not found"}
+    # Get paper details
+    paper = await vector_service.get_paper(paper_id)
 
-        # Send alert email
-        subject = f"New Paper Alert: {paper.title}"
+    if not paper:
+        logger.error("Paper not found: %s", paper_id)
+        return {"status": "failed", "error": "Paper not found"}
 
-        html_content = f"""
+    # Send alert email
+    subject = f"New Paper Alert: {paper.title}"
+
+    html_content = f"""
 <html>
 <body>
     <h2>🔔 New Paper Alert</h2>
@@ -144,18 +146,33 @@ def send_paper_alert(user_email: str, paper_id: str):
 </html>
 """
 
-        success = email_service.send_email(
-            to_email=user_email,
-            subject=subject,
-            html_content=html_content
-        )
+    success = await email_service.send_email(
+        to_email=user_email,
+        subject=subject,
+        html_content=html_content
+    )
 
-        return {
-            "status": "success" if success else "failed",
-            "paper_id": paper_id,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+    return {
+        "status": "success" if success else "failed",
+        "paper_id": paper_id,
+        "timestamp": utc_now_iso()
+    }
 
-    except Exception as e:
-        logger.error(f"Paper alert failed: {e}")
-        return {"status": "failed", "error": str(e)}
+
+def send_paper_alerts_bulk(alerts: List[Tuple[str, str]]) -> GroupResult:
+    """
+    Enqueue many paper alerts at once.
+
+    The alerts are published as one group over a single broker connection
+    instead of one send_paper_alert.delay() round-trip each.
+
+    Args:
+        alerts: (user_email, paper_id) pairs to alert about
+
+    Returns:
+        GroupResult tracking the enqueued alert tasks
+    """
+    return group(
+        send_paper_alert.s(user_email, paper_id)
+        for user_email, paper_id in alerts
+    ).apply_async()
@@ -5,15 +5,23 @@ Scheduled jobs run by Celery.
 from backend.tasks.celery_app import celery_app
 from backend.services.semantic_scholar_service import SemanticScholarService
 from backend.services.embedding_service import EmbeddingService
-from backend.services.vector_service import VectorService
-from backend.services.paper_summarization_service import PaperSummarizationService
-from backend.config.settings import load_config
-from typing import List
+from backend.services.paper_summarization_service import PaperSummarizationService, PaperSummary
+from backend.tasks.shared import get_config, get_redis, get_vector_service, utc_now_iso
+from typing import Dict, List
+import asyncio
+import json
 import logging
-from datetime import datetime
+import redis
 
 logger = logging.getLogger(__name__)
 
+# Papers per embedding request, and embedding requests in flight at once
+EMBED_BATCH_SIZE = 32
+MAX_CONCURRENT_EMBED_BATCHES = 4
+
+# Paper summaries rarely change for a fixed paper and model
+SUMMARY_CACHE_TTL = 30 * 24 * 3600  # 30 days
+
 
 @celery_app.task(name="backend.tasks.paper_tasks.fetch_new_papers", bind=True, max_retries=3)
 def fetch_new_papers(self, fields_of_study: List[str], days_back: int = 7):
@@ -28,86 +36,109 @@ def fetch_new_papers(self, fields_of_study: List[str], days_back: int = 7):
         Dict with stats about papers fetched
     """
     try:
-        config = load_config()
-
-        # Initialize services
-        scholar_service = SemanticScholarService()
-        embedding_service = EmbeddingService(config.mistral.api_key)
-        vector_service = VectorService()
-
-        logger.info(f"Fetching papers from last {days_back} days in fields: {fields_of_study}")
-
-        # Fetch papers
-        papers = []
-        for field in fields_of_study:
-            field_papers = scholar_service.search_papers(
-                query=field,
-                fields_of_study=[field],
-                limit=50
-            )
-            papers.extend(field_papers)
-
-        logger.info(f"Found {len(papers)} total papers")
+        # The services are async; each task run gets its own event loop
+        return asyncio.run(_fetch_new_papers(fields_of_study, days_back))
 
-        # Remove duplicates
-        unique_papers = {p.paper_id: p for p in papers}.values()
-
-        # Generate embeddings and store in vector DB
-        stored_count = 0
-        for paper in unique_papers:
-            if not paper.abstract:
-                continue
+    except Exception as e:
+        logger.error("Paper fetching task failed: %s", e)
+        # Retry with exponential backoff
+        raise self.retry(exc=e, countdown=60 * (2 ** self.request.retries))
 
-            try:
-                # Generate embedding
-                embedding_response = embedding_service.embed_paper(
-                    title=paper.title,
-                    abstract=paper.abstract
-                )
 
-                if not embedding_response:
-                    continue
-
-                # Store in vector DB
-                vector_service.add_paper(
-                    paper_id=paper.paper_id,
-                    title=paper.title,
-                    abstract=paper.abstract,
-                    embedding=embedding_response.embedding,
-                    metadata={
-                        "authors": paper.authors,
-                        "year": paper.year,
-                        "venue": paper.venue,
-                        "citation_count": paper.citation_count,
-                        "url": paper.url,
-                        "fields_of_study": paper.fields_of_study,
-                        "fetched_at": datetime.utcnow().isoformat()
-                    }
-                )
+async def _fetch_new_papers(fields_of_study: List[str], days_back: int) -> Dict:
+    """
+    Search each field concurrently, embed papers in batches, and store them in bulk.
 
-                stored_count += 1
+    Args:
+        fields_of_study: Academic fields to monitor
+        days_back: How many days back to search
 
-            except Exception as e:
-                logger.error(f"Failed to process paper {paper.paper_id}: {e}")
-                continue
+    Returns:
+        Dict with stats about papers fetched
+    """
+    config = get_config()
 
-        # Persist vector DB
-        vector_service.persist()
+    # Initialize services
+    scholar_service = SemanticScholarService()
+    embedding_service = EmbeddingService(config.mistral.api_key)
+    vector_service = get_vector_service()
 
-        logger.info(f"Successfully stored {stored_count} papers")
+    try:
+        logger.info("Fetching papers from last %s days in fields: %s", days_back, fields_of_study)
+
+        # Fetch papers, one concurrent search per field
+        papers, failed_fields = await scholar_service.search_papers_multi(
+            fields_of_study,
+            limit=50
+        )
+
+        logger.info("Found %d total papers", len(papers))
+        if failed_fields:
+            logger.warning("Paper search failed for fields: %s", failed_fields)
+
+        with_abstract = [paper for paper in papers if paper.abstract]
+
+        # Generate embeddings a batch at a time, several batches in flight,
+        # instead of one request per paper
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_EMBED_BATCHES)
+
+        async def _embed_batch(batch: List) -> List:
+            texts = [
+                f"Title: {paper.title}\n\nAbstract: {paper.abstract}"
+                for paper in batch
+            ]
+            async with semaphore:
+                embeddings = await embedding_service.generate_embeddings_batch(
+                    texts, batch_size=len(texts)
+                )
+            if len(embeddings) != len(batch):
+                # A failed request returns nothing for the whole batch
+                logger.error("Failed to embed batch of %d papers", len(batch))
+                return []
+            return list(zip(batch, embeddings))
+
+        embedded = await asyncio.gather(*[
+            _embed_batch(with_abstract[i:i + EMBED_BATCH_SIZE])
+            for i in range(0, len(with_abstract), EMBED_BATCH_SIZE)
+        ])
+
+        # Store in vector DB with one bulk write
+        fetched_at = utc_now_iso()
+        records = [
+            {
+                "paper_id": paper.paper_id,
+                "title": paper.title,
+                "abstract": paper.abstract,
+                "embedding": embedding_response.embedding,
+                "metadata": {
+                    "authors": paper.authors,
+                    "year": paper.year,
+                    "venue": paper.venue,
+                    "citation_count": paper.citation_count,
+                    "url": paper.url,
+                    "fields_of_study": paper.fields_of_study,
+                    "fetched_at": fetched_at
+                }
+            }
+            for batch in embedded
+            for paper, embedding_response in batch
+        ]
+        stored_count = await vector_service.add_papers_batch(records) if records else 0
+
+        logger.info("Successfully stored %d papers", stored_count)
 
         return {
             "status": "success",
-            "papers_found": len(unique_papers),
+            "papers_found": len(papers),
             "papers_stored": stored_count,
             "fields": fields_of_study,
-            "timestamp": datetime.utcnow().isoformat()
+            "failed_fields": failed_fields,
+            "timestamp": utc_now_iso()
         }
 
-    except Exception as e:
-        logger.error(f"Paper fetching task failed: {e}")
-        # Retry with exponential backoff
-        raise self.retry(exc=e, countdown=60 * (2 ** self.request.retries))
+    finally:
+        await scholar_service.close()
+        await embedding_service.close()
 
 
 @celery_app.task(name="backend.tasks.paper_tasks.update_paper_embeddings")
@@ -125,11 +156,11 @@ def update_paper_embeddings():
         return {
             "status": "success",
             "papers_updated": 0,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_now_iso()
         }
 
     except Exception as e:
-        logger.error(f"Embedding update failed: {e}")
+        logger.error("Embedding update failed: %s", e)
         return {"status": "failed", "error": str(e)}
 
 
@@ -138,6 +169,9 @@ def summarize_papers_for_topic(topic: str, paper_ids: List[str]):
     """
     Generate summaries for a list of papers on a specific topic.
 
+    Summaries are cached in Redis per paper and model, so papers that
+    reappear across topic runs skip the LLM call.
+
     Args:
         topic: Research topic
         paper_ids: List of paper IDs to summarize
@@ -146,40 +180,117 @@ def summarize_papers_for_topic(topic: str, paper_ids: List[str]):
         Dict with summaries
     """
     try:
-        config = load_config()
+        config = get_config()
+        model = PaperSummarizationService.DEFAULT_MODEL
+
+        # Each paper is summarized once even if listed more than once
+        paper_ids = list(dict.fromkeys(paper_ids))
+        keys = [_summary_cache_key(paper_id, model) for paper_id in paper_ids]
+
+        redis_client = get_redis()
+        try:
+            cached = redis_client.mget(keys)
+        except redis.RedisError as e:
+            logger.warning("Summary cache read failed: %s", e)
+            cached = [None] * len(keys)
+
+        summaries_by_id = {
+            paper_id: json.loads(hit)
+            for paper_id, hit in zip(paper_ids, cached)
+            if hit is not None
+        }
+        missing = [paper_id for paper_id in paper_ids if paper_id not in summaries_by_id]
 
-        # Initialize services
-        vector_service = VectorService()
-        summarization_service = PaperSummarizationService(config.mistral.api_key)
+        if missing:
+            generated = asyncio.run(
+                _summarize_papers(missing, config.mistral.api_key, model)
+            )
+            summaries_by_id.update(
+                (paper_id, summary.to_dict()) for paper_id, summary in generated.items()
+            )
 
-        summaries = []
+            # Fallback summaries are not cached so the LLM is retried next run
+            try:
+                pipe = redis_client.pipeline(transaction=False)
+                for paper_id, summary in generated.items():
+                    if not summary.is_fallback:
+                        pipe.setex(
+                            _summary_cache_key(paper_id, model),
+                            SUMMARY_CACHE_TTL,
+                            json.dumps(summary.to_dict())
+                        )
+                pipe.execute()
+            except redis.RedisError as e:
+                logger.warning("Summary cache write failed: %s", e)
+
+        summaries = [
+            summaries_by_id[paper_id]
+            for paper_id in paper_ids
+            if paper_id in summaries_by_id
+        ]
+
+        logger.info(
+            "Generated %d summaries for topic: %s (%d cached)",
+            len(summaries), topic, len(paper_ids) - len(missing)
+        )
+
+        return {
+            "status": "success",
+            "summaries": summaries,
+            "topic": topic,
+            "timestamp": utc_now_iso()
+        }
+
+    except Exception as e:
+        logger.error("Summarization task failed: %s", e)
+        return {"status": "failed", "error": str(e)}
+
+
+def _summary_cache_key(paper_id: str, model: str) -> str:
+    """Build the Redis key for a paper's cached summary."""
+    return f"paper_summary:{model}:{paper_id}"
+
+
+async def _summarize_papers(
+    paper_ids: List[str],
+    api_key: str,
+    model: str
+) -> Dict[str, PaperSummary]:
+    """
+    Summarize papers from the vector store with the LLM.
+
+    Args:
+        paper_ids: Papers to summarize
+        api_key: Mistral API key
+        model: Mistral model to summarize with
+
+    Returns:
+        Dict mapping paper ID to summary; papers not in the store are omitted
+    """
+    vector_service = get_vector_service()
+    summarization_service = PaperSummarizationService(api_key, model=model)
+
+    try:
+        summaries: Dict[str, PaperSummary] = {}
 
         for paper_id in paper_ids:
             # Get paper from vector DB
-            paper = vector_service.get_paper(paper_id)
+            paper = await vector_service.get_paper(paper_id)
 
             if not paper:
                 continue
 
             # Generate summary
-            summary = summarization_service.summarize_paper(
+            summary = await summarization_service.summarize_paper(
                 title=paper.title,
                 abstract=paper.abstract,
                 authors=paper.metadata.get("authors", [])
             )
 
             summary.paper_id = paper_id
-            summaries.append(summary.to_dict())
-
-        logger.info(f"Generated {len(summaries)} summaries for topic: {topic}")
+            summaries[paper_id] = summary
 
-        return {
-            "status": "success",
-            "summaries": summaries,
-            "topic": topic,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        return summaries
 
-    except Exception as e:
-        logger.error(f"Summarization task failed: {e}")
-        return {"status": "failed", "error": str(e)}
+    finally:
+        await summarization_service.close()
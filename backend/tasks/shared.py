@@ -0,0 +1,86 @@
+"""
+Per-worker shared configuration and services for background tasks.
+
+Config comes from environment variables that don't change during a worker
+process's lifetime, so it and the services that hold no event-loop-bound
+state are built once per process instead of once per task. Services that
+own an httpx.AsyncClient are still created per task: each task runs its
+own asyncio.run() loop, and pooled connections can't outlive that loop.
+"""
+from datetime import datetime, timezone
+from functools import lru_cache
+import time
+
+import redis
+
+from backend.config.settings import AppConfig, load_config
+from backend.services.email_service import EmailService, EmailConfig
+from backend.services.vector_service import VectorService
+from backend.tasks.celery_app import REDIS_URL
+
+
+@lru_cache(maxsize=1)
+def _iso_for_second(second: int) -> str:
+    """Format a Unix second as an ISO-8601 UTC string."""
+    return datetime.fromtimestamp(second, tz=timezone.utc).isoformat()
+
+
+def utc_now_iso() -> str:
+    """
+    Get the current UTC time as an ISO-8601 string, to the second.
+
+    Tasks finishing within the same second reuse one formatted string.
+
+    Returns:
+        Timestamp such as "2024-01-01T08:00:00+00:00"
+    """
+    return _iso_for_second(int(time.time()))
+
+
+@lru_cache(maxsize=1)
+def get_config() -> AppConfig:
+    """
+    Get the application config, loaded once per worker process.
+
+    Returns:
+        Application configuration
+    """
+    return load_config()
+
+
+@lru_cache(maxsize=1)
+def get_redis() -> redis.Redis:
+    """
+    Get a client for the Redis instance that backs the broker.
+
+    Returns:
+        Shared Redis client
+    """
+    return redis.Redis.from_url(REDIS_URL)
+
+
+@lru_cache(maxsize=1)
+def get_vector_service() -> VectorService:
+    """
+    Get the worker's paper vector store.
+
+    Returns:
+        Shared VectorService instance
+    """
+    return VectorService()
+
+
+@lru_cache(maxsize=1)
+def get_email_service() -> EmailService:
+    """
+    Get the worker's email client.
+
+    Returns:
+        Shared EmailService instance
+    """
+    config = get_config()
+    return EmailService(EmailConfig(
+        api_key=config.email.api_key,
+        from_email=config.email.from_email,
+        from_name=config.email.from_name
+    ))
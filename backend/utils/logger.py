@@ -1,10 +1,66 @@
 """
 Logging utility module.
 Centralized logging configuration.
+
+Loggers hand records to a queue, and a single background listener thread
+writes them to stdout, so a log call never blocks on console I/O.
 """
+import atexit
 import logging
+import os
+import queue
 import sys
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+
+
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+_log_queue: Optional[queue.Queue] = None
+_listener: Optional[QueueListener] = None
+_queue_handlers: List[QueueHandler] = []
+
+
+def _start_listener() -> None:
+    """Start the listener thread that writes queued records to stdout."""
+    global _log_queue, _listener
+
+    _log_queue = queue.Queue(-1)
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(_FORMATTER)
+
+    _listener = QueueListener(_log_queue, console)
+    _listener.start()
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    if _listener is not None:
+        _listener.stop()
+
+
+def _restart_listener_in_child() -> None:
+    """
+    Give a forked process (e.g. a Celery prefork worker) its own listener.
+
+    The parent's listener thread doesn't survive fork, and its queue may
+    have been locked mid-operation, so existing handlers are pointed at a
+    fresh queue.
+    """
+    if _log_queue is None:
+        return
+
+    _start_listener()
+    for handler in _queue_handlers:
+        handler.queue = _log_queue
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listener_in_child)
+atexit.register(_stop_listener)
 
 
 def setup_logger(name: str, level: Optional[int] = None) -> logging.Logger:
@@ -28,16 +84,13 @@ def setup_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     if logger.handlers:
         return logger
 
-    # Console handler
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(level)
+    if _log_queue is None:
+        _start_listener()
 
-    # Formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    handler.setFormatter(formatter)
+    # Queue handler; the listener thread does the console write
+    handler = QueueHandler(_log_queue)
+    handler.setLevel(level)
+    _queue_handlers.append(handler)
 
     logger.addHandler(handler)
 
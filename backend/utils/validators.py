@@ -5,6 +5,15 @@ Input validation logic separated from business logic.
 from typing import Optional, Tuple
 
 
+# Shared success result, so valid input allocates nothing
+_OK: Tuple[bool, Optional[str]] = (True, None)
+
+MAX_MESSAGE_LENGTH = 10000
+
+_EMPTY_MESSAGE = (False, "Message cannot be empty")
+_MESSAGE_TOO_LONG = (False, f"Message exceeds maximum length of {MAX_MESSAGE_LENGTH} characters")
+
+
 class ValidationError(Exception):
     """Custom validation error."""
     pass
@@ -20,16 +29,25 @@ def validate_message(message: str) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
+    # Fast path for plain strings, the overwhelmingly common case
+    if type(message) is str:
+        length = len(message)
+        if length == 0:
+            return _EMPTY_MESSAGE
+        if length > MAX_MESSAGE_LENGTH:
+            return _MESSAGE_TOO_LONG
+        return _OK
+
     if not message:
-        return False, "Message cannot be empty"
+        return _EMPTY_MESSAGE
 
     if not isinstance(message, str):
         return False, "Message must be a string"
 
-    if len(message) > 10000:
-        return False, "Message exceeds maximum length of 10000 characters"
+    if len(message) > MAX_MESSAGE_LENGTH:
+        return _MESSAGE_TOO_LONG
 
-    return True, None
+    return _OK
 
 
 def validate_conversation_id(conversation_id: Optional[str]) -> Tuple[bool, Optional[str]]:
@@ -43,7 +61,7 @@ def validate_conversation_id(conversation_id: Optional[str]) -> Tuple[bool, Opti
         Tuple of (is_valid, error_message)
     """
     if conversation_id is None:
-        return True, None  # Optional field
+        return _OK  # Optional field
 
     if not isinstance(conversation_id, str):
         return False, "Conversation ID must be a string"
@@ -51,7 +69,7 @@ def validate_conversation_id(conversation_id: Optional[str]) -> Tuple[bool, Opti
     if len(conversation_id) == 0:
         return False, "Conversation ID cannot be empty"
 
-    return True, None
+    return _OK
 
 
 def validate_model_params(
@@ -80,4 +98,40 @@ def validate_model_params(
         if max_tokens < 1 or max_tokens > 32000:
             return False, "Max tokens must be between 1 and 32000"
 
-    return True, None
+    return _OK
+
+
+def validate_chat_request(
+    message: str,
+    conversation_id: Optional[str] = None,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None
+) -> Tuple[bool, Optional[str]]:
+    """
+    Validate all fields of a chat request in a single call.
+
+    Equivalent to running validate_message, validate_conversation_id and
+    validate_model_params in order and returning the first failure.
+
+    Args:
+        message: The message to validate
+        conversation_id: The conversation ID to validate
+        temperature: Temperature parameter
+        max_tokens: Max tokens parameter
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    result = validate_message(message)
+    if result is not _OK:
+        return result
+
+    if conversation_id is not None:
+        result = validate_conversation_id(conversation_id)
+        if result is not _OK:
+            return result
+
+    if temperature is None and max_tokens is None:
+        return _OK
+
+    return validate_model_params(temperature, max_tokens)